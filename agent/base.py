@@ -5,9 +5,10 @@ This module defines the domain models and abstract interfaces that all component
 """
 
 from __future__ import annotations
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, AsyncIterator
+from typing import Callable, Dict, List, Mapping, Optional, Any, AsyncIterator, Sequence, Tuple
 from datetime import datetime
 
 
@@ -15,9 +16,17 @@ from datetime import datetime
 # Domain models
 # -----------------------------
 
+# Slotted dataclasses with defaults need dataclass(slots=True), added in 3.10;
+# older interpreters get a regular dataclass
+_SLOTTED = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 @dataclass
 class Candle:
     """OHLCV candle data structure."""
+    # Slotted: streaming agents hold hundreds of these per token, and slots cut
+    # each one to a fixed-size record with no per-instance __dict__
+    __slots__ = ("ts", "open", "high", "low", "close", "volume")
+
     ts: datetime
     open: float
     high: float
@@ -30,16 +39,22 @@ class Candle:
 class MarketSnapshot:
     """Market data snapshot containing recent candles."""
     symbol: str
-    candles: List[Candle]  # ordered oldest -> newest
+    candles: Sequence[Candle]  # ordered oldest -> newest; a list, or a bounded deque when streaming
 
 
-@dataclass
+@dataclass(**_SLOTTED)
 class Signal:
-    """Trading signal with confidence and metadata."""
+    """
+    Trading signal with confidence and metadata.
+    
+    Slotted because strategies create one per symbol per tick. Not frozen:
+    frozen dataclasses set every field through object.__setattr__, which
+    makes construction several times slower.
+    """
     symbol: str
     side: str  # 'buy', 'sell', 'flat'
     confidence: float  # 0.0 to 1.0
-    meta: Dict[str, Any] = field(default_factory=dict)
+    meta: Mapping[str, Any] = field(default_factory=dict)  # may be a shared read-only mapping
 
 
 @dataclass
@@ -125,6 +140,8 @@ class AsyncMarketDataProvider(ABC):
 class SignalProcessor(ABC):
     """Abstract base class for trading signal processors."""
 
+    __slots__ = ()
+
     @abstractmethod
     def generate(self, snapshot: MarketSnapshot) -> Signal:
         """
@@ -159,6 +176,16 @@ class TradeExecutor(ABC):
 class PreTradeFilter(ABC):
     """Optional filters to suppress low-quality signals."""
 
+    __slots__ = ()
+
+    # True if allow() never blocks a 'flat' signal; agents then skip the
+    # filter entirely for flats instead of calling into it
+    always_allows_flat: bool = False
+
+    # True if allow() never looks at the signal (e.g. trading hours); agents can
+    # then check it before running the strategy and skip signal generation
+    ignores_signal: bool = False
+
     @abstractmethod
     def allow(self, snapshot: MarketSnapshot, signal: Signal) -> bool:
         """
@@ -172,3 +199,16 @@ class PreTradeFilter(ABC):
             True if signal should be allowed, False to block
         """
         raise NotImplementedError
+
+
+FilterCheck = Tuple[Callable[[MarketSnapshot, Signal], bool], str]
+
+
+def filter_checks(filters: Sequence[PreTradeFilter]) -> Tuple[FilterCheck, ...]:
+    """
+    (bound `allow` method, class name) for each filter.
+    
+    Agents resolve these once at construction so the per-signal loop neither
+    looks up `allow` nor rebuilds the filter's name when it blocks.
+    """
+    return tuple((f.allow, type(f).__name__) for f in filters)
@@ -0,0 +1,281 @@
+"""
+Caching layer for market data providers.
+
+Wraps any MarketDataProvider so repeated snapshot requests inside the same
+candle window are served from memory (and optionally disk) instead of being
+re-fetched, and lets several streaming agents share one AsyncMarketDataProvider
+subscription.
+"""
+
+from __future__ import annotations
+import asyncio
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from .base import AsyncMarketDataProvider, Candle, MarketDataProvider, MarketSnapshot
+
+log = logging.getLogger(__name__)
+
+_TIMEFRAME_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def timeframe_seconds(timeframe: str) -> int:
+    """
+    Convert a timeframe string such as '15m', '1h' or '1d' to seconds.
+
+    Args:
+        timeframe: Candle timeframe
+
+    Returns:
+        Length of one candle in seconds
+    """
+    unit = _TIMEFRAME_UNITS.get(timeframe[-1:].lower())
+    if unit is None or not timeframe[:-1].isdigit():
+        raise ValueError(f"Unsupported timeframe: {timeframe!r}")
+    return int(timeframe[:-1]) * unit
+
+
+class TTLCache:
+    """
+    Key/value cache with per-entry expiry, optionally persisted as JSON files.
+
+    Entries live in memory; when `cache_dir` is set each entry is also written
+    to `<cache_dir>/<path>.json` with its store timestamp, so a restarted
+    process can reuse data fetched by the previous one. Expired entries are
+    dropped from memory on every `set`, so keys that are never read again
+    (e.g. ones containing a time window) don't accumulate.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = cache_dir
+        # key -> (store timestamp, expiry timestamp, value)
+        self._entries: Dict[Tuple, Tuple[float, float, Any]] = {}
+
+    def _file_path(self, path: str) -> str:
+        return os.path.join(self.cache_dir, path + ".json")
+
+    def get(self, key: Tuple, path: str, ttl: float) -> Optional[Any]:
+        """
+        Return the cached value for `key` if it is younger than `ttl` seconds.
+
+        Args:
+            key: In-memory cache key
+            path: Relative file path (without extension) for the disk copy
+            ttl: Maximum entry age in seconds
+
+        Returns:
+            Cached value or None on a miss
+        """
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is not None:
+            stored_ts, _, value = entry
+            if now - stored_ts < ttl:
+                return value
+            del self._entries[key]
+
+        if self.cache_dir is None:
+            return None
+
+        try:
+            with open(self._file_path(path), "r") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if payload.get("key") != list(key) or now - payload.get("ts", 0.0) >= ttl:
+            return None
+
+        value = payload.get("value")
+        self._entries[key] = (payload["ts"], payload["ts"] + ttl, value)
+        return value
+
+    def set(self, key: Tuple, path: str, value: Any, ttl: float) -> None:
+        """
+        Store a JSON-serializable value under `key`.
+
+        Args:
+            key: In-memory cache key
+            path: Relative file path (without extension) for the disk copy
+            value: Value to cache
+            ttl: Seconds after which the in-memory entry is pruned
+        """
+        stored_ts = time.time()
+        self._prune(stored_ts)
+        self._entries[key] = (stored_ts, stored_ts + ttl, value)
+
+        if self.cache_dir is None:
+            return
+
+        file_path = self._file_path(path)
+        tmp_path = file_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump({"key": list(key), "ts": stored_ts, "value": value}, f)
+            os.replace(tmp_path, file_path)
+        except OSError as e:
+            log.warning(f"Failed to write cache file {file_path}: {e}")
+
+    def _prune(self, now: float) -> None:
+        """Drop in-memory entries past their expiry (disk copies are left alone)."""
+        expired = [key for key, (_, expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+
+
+class CachedMarketData(MarketDataProvider):
+    """
+    MarketDataProvider wrapper that caches snapshots per candle window.
+
+    Snapshots are keyed by (symbol, timeframe, lookback, candle window), where
+    the window is `floor(now / timeframe_seconds)`. Polling faster than the
+    candle interval therefore hits the cache until a new candle opens.
+    """
+
+    def __init__(self, provider: MarketDataProvider, cache_dir: Optional[str] = None,
+                 ttl: Optional[float] = None):
+        """
+        Initialize the caching wrapper.
+
+        Args:
+            provider: Underlying market data provider
+            cache_dir: Directory for the on-disk copy (memory only if None)
+            ttl: Maximum snapshot age in seconds (defaults to one candle interval minus 1s)
+        """
+        self.provider = provider
+        self.ttl = ttl
+        self._cache = TTLCache(cache_dir)
+
+    def get_snapshot(self, symbol: str, lookback: int = 200, timeframe: str = "1h") -> MarketSnapshot:
+        interval = timeframe_seconds(timeframe)
+        ttl = self.ttl if self.ttl is not None else max(interval - 1, 1)
+        window = int(time.time() // interval)
+        key = (symbol, timeframe, lookback, window)
+        path = os.path.join(symbol, f"{timeframe}_{lookback}")
+
+        rows = self._cache.get(key, path, ttl)
+        if rows is not None:
+            candles = [
+                Candle(ts=datetime.fromisoformat(ts), open=o, high=h, low=l, close=c, volume=v)
+                for ts, o, h, l, c, v in rows
+            ]
+            return MarketSnapshot(symbol=symbol, candles=candles)
+
+        snap = self.provider.get_snapshot(symbol, lookback, timeframe)
+        self._cache.set(key, path, [
+            [c.ts.isoformat(), c.open, c.high, c.low, c.close, c.volume]
+            for c in snap.candles
+        ], ttl)
+        return snap
+
+
+class SharedTickProvider(AsyncMarketDataProvider):
+    """
+    AsyncMarketDataProvider wrapper that fans one upstream subscription out to many consumers.
+    
+    All subscribers for the same (tokens, interval) receive every polling
+    cycle's batch from a single upstream fetch loop. The loop starts with the
+    first subscriber and is cancelled when the last one closes its stream;
+    subscribers that join late start from the next cycle.
+    """
+
+    def __init__(self, provider: AsyncMarketDataProvider):
+        """
+        Initialize the fan-out wrapper.
+        
+        Args:
+            provider: Underlying streaming provider
+        """
+        self.provider = provider
+        # (tokens, interval) -> (upstream task, subscriber queues)
+        self._feeds: Dict[Tuple, Tuple[asyncio.Task, List[asyncio.Queue]]] = {}
+
+    async def _upstream_batches(self, tokens: List[str], interval_sec: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        subscribe_batches = getattr(self.provider, "subscribe_batches", None)
+        if subscribe_batches is not None:
+            source = subscribe_batches(tokens, interval_sec)
+            try:
+                async for batch in source:
+                    yield batch
+            finally:
+                await source.aclose()
+            return
+        
+        # Plain tick stream: group every len(tokens) ticks into one cycle
+        source = self.provider.subscribe_ticks(tokens, interval_sec)
+        batch: List[Dict[str, Any]] = []
+        try:
+            async for tick in source:
+                batch.append(tick)
+                if len(batch) >= len(tokens):
+                    yield batch
+                    batch = []
+        finally:
+            aclose = getattr(source, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    async def _pump(self, tokens: List[str], interval_sec: int, queues: List[asyncio.Queue]) -> None:
+        """Copy each upstream batch to every subscriber queue; None marks the end."""
+        end: Optional[BaseException] = None
+        source = self._upstream_batches(tokens, interval_sec)
+        try:
+            async for batch in source:
+                for queue in queues:
+                    queue.put_nowait(batch)
+        except Exception as e:
+            end = e
+        finally:
+            await source.aclose()
+            for queue in queues:
+                queue.put_nowait(end)
+
+    async def subscribe_ticks(self, tokens: List[str], interval_sec: int = 10) -> AsyncIterator[Dict[str, Any]]:
+        batches = self.subscribe_batches(tokens, interval_sec)
+        try:
+            async for batch in batches:
+                for tick in batch:
+                    yield tick
+        finally:
+            await batches.aclose()
+
+    async def subscribe_batches(self, tokens: List[str], interval_sec: int = 10) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream the shared upstream's ticks, one list per polling cycle.
+        
+        Args:
+            tokens: Token identifiers; subscribers share a feed only for the same list
+            interval_sec: Update interval in seconds
+            
+        Yields:
+            List of tick dicts, one per token, on each interval
+        """
+        key = (tuple(tokens), interval_sec)
+        feed = self._feeds.get(key)
+        if feed is None or feed[0].done():
+            queues: List[asyncio.Queue] = []
+            feed = self._feeds[key] = (asyncio.create_task(self._pump(list(tokens), interval_sec, queues)), queues)
+        task, queues = feed
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        queues.append(queue)
+        try:
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    return
+                if isinstance(batch, BaseException):
+                    raise batch
+                yield batch
+        finally:
+            queues.remove(queue)
+            if not queues and self._feeds.get(key) is feed:
+                del self._feeds[key]
+                task.cancel()
+                # Let the upstream close its generator before returning
+                await asyncio.wait([task])
@@ -9,7 +9,8 @@ import asyncio
 import os
 import random
 import logging
-from typing import Any, AsyncIterator, Dict, List, Optional
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import aiohttp
 from dotenv import load_dotenv
@@ -24,6 +25,30 @@ log = logging.getLogger(__name__)
 # Dexscreener API endpoints
 DEXSCREENER_BASE = "https://api.dexscreener.com/latest/dex"
 
+# Backoff (seconds) before re-querying a token that returned no Solana pair;
+# doubles on every further empty answer up to the max
+EMPTY_RESULT_BACKOFF_START = 30.0
+EMPTY_RESULT_BACKOFF_MAX = 300.0
+
+
+def create_http_session() -> aiohttp.ClientSession:
+    """
+    Create an aiohttp session tuned for repeated Dexscreener polling.
+    
+    Connections are kept alive between polling cycles and DNS lookups are
+    cached, so each cycle reuses warm TCP/TLS connections. Pass one session to
+    every provider that should share the pool; the caller owns and closes it.
+    Must be called from within a running event loop.
+    """
+    timeout = aiohttp.ClientTimeout(total=20, connect=5)
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=10,
+        keepalive_timeout=60,
+        ttl_dns_cache=300,
+    )
+    return aiohttp.ClientSession(timeout=timeout, connector=connector)
+
 
 def _pick_best_pair(pairs: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
     """
@@ -68,6 +93,10 @@ class DexScreenerSolanaProvider(AsyncMarketDataProvider):
     - Maintains Solana RPC connection for network health monitoring
     - Handles API rate limiting with jitter
     - Robust error handling with fallback data
+    
+    Used as `async with DexScreenerSolanaProvider() as provider:`, the HTTP
+    session and RPC client stay open across subscriptions until the block
+    exits; otherwise each subscription opens and closes them itself.
     """
 
     def __init__(self, base_rpc: Optional[str] = None, session: Optional[aiohttp.ClientSession] = None):
@@ -76,26 +105,38 @@ class DexScreenerSolanaProvider(AsyncMarketDataProvider):
         
         Args:
             base_rpc: Custom Solana RPC URL (defaults to mainnet-beta)
-            session: Optional aiohttp session (will create if not provided)
+            session: Optional shared aiohttp session, e.g. from `create_http_session()`
+                (one is created per subscription and closed with it if not provided)
         """
         load_dotenv()
         self._rpc_url = base_rpc or os.getenv("SOLANA_RPC", "https://api.mainnet-beta.solana.com")
         self._session = session
         self._own_session = session is None
         self._client: Optional[AsyncClient] = None
+        # Inside `async with`: subscriptions leave the clients open for __aexit__
+        self._in_context = False
+        # token -> (retry-not-before monotonic time, current backoff) for tokens with no pair
+        self._empty_results: Dict[str, Tuple[float, float]] = {}
         
         log.info(f"Initialized DexScreenerSolanaProvider with RPC: {self._rpc_url}")
 
     async def _ensure_clients(self):
         """Ensure HTTP session and Solana RPC client are initialized."""
         if self._session is None:
-            timeout = aiohttp.ClientTimeout(total=20, connect=5)
-            connector = aiohttp.TCPConnector(limit=100, limit_per_host=10)
-            self._session = aiohttp.ClientSession(timeout=timeout, connector=connector)
+            self._session = create_http_session()
             
         if self._client is None:
             self._client = AsyncClient(self._rpc_url)
 
+    async def __aenter__(self) -> "DexScreenerSolanaProvider":
+        await self._ensure_clients()
+        self._in_context = True
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._in_context = False
+        await self._close()
+
     async def _close(self):
         """Clean up resources."""
         if self._client:
@@ -118,31 +159,49 @@ class DexScreenerSolanaProvider(AsyncMarketDataProvider):
         """
         if self._session is None:
             raise RuntimeError("HTTP session not initialized")
+        
+        # Known to have no pair: skip the request until its backoff expires
+        empty = self._empty_results.get(token)
+        if empty is not None and time.monotonic() < empty[0]:
+            return None
             
         url = f"{DEXSCREENER_BASE}/tokens/{token}"
         
         try:
             async with self._session.get(url) as resp:
                 if resp.status == 429:  # Rate limited
-                    log.warning(f"Rate limited for token {token}, backing off")
+                    log.warning("Rate limited for token %s, backing off", token)
                     await asyncio.sleep(1 + random.random() * 2)
                     return None
                     
                 if resp.status != 200:
-                    log.warning(f"API error {resp.status} for token {token}")
+                    log.warning("API error %s for token %s", resp.status, token)
                     return None
                     
                 data = await resp.json()
                 pairs = data.get("pairs", [])
-                return _pick_best_pair(pairs)
+                best = _pick_best_pair(pairs)
+                self._record_result(token, best is not None)
+                return best
                 
         except asyncio.TimeoutError:
-            log.warning(f"Timeout fetching data for token {token}")
+            log.warning("Timeout fetching data for token %s", token)
             return None
         except Exception as e:
-            log.error(f"Error fetching data for token {token}: {e}")
+            log.error("Error fetching data for token %s: %s", token, e)
             return None
 
+    def _record_result(self, token: str, found: bool) -> None:
+        """Update the no-data backoff for a token after a successful API response."""
+        if found:
+            self._empty_results.pop(token, None)
+            return
+        
+        empty = self._empty_results.get(token)
+        backoff = EMPTY_RESULT_BACKOFF_START if empty is None else min(empty[1] * 2, EMPTY_RESULT_BACKOFF_MAX)
+        self._empty_results[token] = (time.monotonic() + backoff, backoff)
+        log.debug("No Solana pair for token %s, skipping it for %.0fs", token, backoff)
+
     async def _rpc_health(self) -> SolanaHealthInfo:
         """
         Check Solana RPC health and get latest slot.
@@ -173,7 +232,7 @@ class DexScreenerSolanaProvider(AsyncMarketDataProvider):
             )
             
         except Exception as e:
-            log.warning(f"RPC health check failed: {e}")
+            log.warning("RPC health check failed: %s", e)
             return SolanaHealthInfo(
                 rpc_healthy=False,
                 slot=None,
@@ -260,6 +319,32 @@ class DexScreenerSolanaProvider(AsyncMarketDataProvider):
         Yields:
             TokenTick data as dict for each token on each interval
         """
+        batches = self.subscribe_batches(tokens, interval_sec)
+        try:
+            async for batch in batches:
+                for tick in batch:
+                    yield tick
+        finally:
+            await batches.aclose()
+
+    async def subscribe_batches(
+        self,
+        tokens: List[str],
+        interval_sec: int = 10,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream live token ticks from Dexscreener API, one list per polling cycle.
+        
+        Same data as `subscribe_ticks`, but every token's tick from a cycle is
+        delivered together so consumers can process the cycle as a batch.
+        
+        Args:
+            tokens: List of SPL mint addresses (preferred) or symbols
+            interval_sec: Update interval in seconds (default: 10)
+            
+        Yields:
+            List of TokenTick dicts, one per token, on each interval
+        """
         if not tokens:
             log.warning("No tokens provided for subscription")
             return
@@ -274,6 +359,7 @@ class DexScreenerSolanaProvider(AsyncMarketDataProvider):
                 
                 # Fetch data for each token
                 results: List[TokenTick] = []
+                debug_enabled = log.isEnabledFor(logging.DEBUG)
                 for token in tokens:
                     try:
                         pair = await self._fetch_token_best_pair(token)
@@ -281,14 +367,15 @@ class DexScreenerSolanaProvider(AsyncMarketDataProvider):
                         results.append(tick)
                         
                         # Log successful data fetch
-                        if tick.price_usd is not None:
-                            log.debug(f"Token {token}: ${tick.price_usd:.6f} "
-                                    f"(24h: {tick.change_24h_pct:+.2f}% if tick.change_24h_pct else 'N/A')")
-                        else:
-                            log.debug(f"Token {token}: No price data available")
+                        if debug_enabled:
+                            if tick.price_usd is not None:
+                                change = f"{tick.change_24h_pct:+.2f}%" if tick.change_24h_pct is not None else "N/A"
+                                log.debug("Token %s: $%.6f (24h: %s)", token, tick.price_usd, change)
+                            else:
+                                log.debug("Token %s: No price data available", token)
                             
                     except Exception as e:
-                        log.error(f"Error processing token {token}: {e}")
+                        log.error("Error processing token %s: %s", token, e)
                         # Create failed tick but still yield something
                         results.append(
                             TokenTick(
@@ -306,9 +393,8 @@ class DexScreenerSolanaProvider(AsyncMarketDataProvider):
                     # Add jitter to be API-friendly
                     await asyncio.sleep(0.05 + random.random() * 0.1)
 
-                # Yield each tick as dict (JSON-serializable)
-                for tick in results:
-                    yield tick.model_dump()
+                # Yield the cycle's ticks as dicts (JSON-serializable)
+                yield [tick.model_dump() for tick in results]
 
                 # Wait until next cycle
                 await asyncio.sleep(interval_sec)
@@ -320,7 +406,8 @@ class DexScreenerSolanaProvider(AsyncMarketDataProvider):
             log.error(f"Unexpected error in tick subscription: {e}")
             raise
         finally:
-            await self._close()
+            if not self._in_context:
+                await self._close()
 
 
 # Popular Solana token mint addresses for reference
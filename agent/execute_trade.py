@@ -8,15 +8,15 @@ including Photon and GMGN with comprehensive logging and error handling.
 import asyncio
 import json
 import os
-from typing import Literal, Optional
+from typing import Callable, Dict, Literal, Optional
 import argparse
 import sys
 
 from dotenv import load_dotenv
 from pydantic import ValidationError
 
-from agent.executor_base import ExecutionRequest, QuoteRequest, TransactionType
-from agent.executors import PhotonExecutor, GmgnExecutor, AutoExecutor
+from agent.executor_base import ExecutionRequest, QuoteRequest, TransactionExecutor, TransactionType
+from agent.executors import PhotonExecutor, GmgnExecutor, AutoExecutor, close_rpc_clients, close_photon_session
 from agent.tx_logger import TxLogger, set_global_logger
 
 
@@ -31,6 +31,14 @@ COMMON_TOKENS = {
 }
 
 
+# --provider value -> executor factory
+_EXECUTOR_FACTORIES: Dict[str, Callable[[argparse.Namespace], TransactionExecutor]] = {
+    "auto": lambda args: AutoExecutor(strategy=args.strategy),
+    "photon": lambda args: PhotonExecutor(),
+    "gmgn": lambda args: GmgnExecutor(),
+}
+
+
 def resolve_token_address(token: str) -> str:
     """Resolve a token symbol to its mint address."""
     if token.upper() in COMMON_TOKENS:
@@ -72,7 +80,7 @@ Environment Variables:
     # Core trading parameters
     parser.add_argument(
         "--provider", "-p",
-        choices=["auto", "photon", "gmgn"],
+        choices=list(_EXECUTOR_FACTORIES),
         default="auto",
         help="DEX aggregator to use (default: auto)"
     )
@@ -303,12 +311,7 @@ async def main():
     set_global_logger(logger)
     
     # Create executor
-    if args.provider == "photon":
-        executor = PhotonExecutor()
-    elif args.provider == "gmgn":
-        executor = GmgnExecutor()
-    else:  # auto
-        executor = AutoExecutor(strategy=args.strategy)
+    executor = _EXECUTOR_FACTORIES[args.provider](args)
     
     success = False
     
@@ -332,6 +335,10 @@ async def main():
         logger.error(f"CLI execution failed: {e}")
         return 1
     
+    finally:
+        await close_photon_session()
+        await close_rpc_clients()
+    
     return 0 if success else 1
 
 
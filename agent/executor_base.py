@@ -6,6 +6,7 @@ DEX aggregators and APIs like Photon and GMGN.
 """
 
 from __future__ import annotations
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, Field
@@ -140,6 +141,27 @@ class TransactionExecutor(ABC):
         """
         raise NotImplementedError
     
+    async def get_quotes(self, reqs: List[QuoteRequest]) -> List[QuoteResult]:
+        """
+        Get quotes for several requests at once.
+        
+        Default implementation issues the individual quotes concurrently so
+        they share the provider's connection pool (and any quote cache or
+        request coalescing). Override if the provider has a multi-quote endpoint.
+        
+        Args:
+            reqs: Quote requests
+            
+        Returns:
+            QuoteResults in the same order as `reqs`
+        """
+        results = await asyncio.gather(*(self.get_quote(req) for req in reqs), return_exceptions=True)
+        return [
+            QuoteResult(ok=False, provider=self.name, error=f"Quote failed: {type(r).__name__}: {r}")
+            if isinstance(r, BaseException) else r
+            for r in results
+        ]
+    
     async def execute_sell(self, req: ExecutionRequest) -> ExecutionResult:
         """
         Execute a sell order through this provider.
@@ -250,14 +272,17 @@ class MultiExecutor(TransactionExecutor):
             slippage_bps=req.slippage_bps
         )
         
-        quotes = []
-        for executor in self.executors:
+        async def quote_from(executor: TransactionExecutor):
             try:
                 quote = await executor.get_quote(quote_req)
-                if quote.ok and quote.amount_out:
-                    quotes.append((executor, quote))
             except Exception:
-                continue
+                return None
+            return (executor, quote) if quote.ok and quote.amount_out else None
+        
+        # Quotes are independent of each other, so fetch them concurrently
+        # (quote_from never raises, so gather needs no exception handling)
+        results = await asyncio.gather(*(quote_from(executor) for executor in self.executors))
+        quotes = [quote for quote in results if quote is not None]
         
         if not quotes:
             return ExecutionResult(
@@ -274,23 +299,25 @@ class MultiExecutor(TransactionExecutor):
     
     async def _execute_fastest(self, req: ExecutionRequest) -> ExecutionResult:
         """Execute with all providers concurrently and return the first success."""
-        import asyncio
-        
         # Create tasks for all executors
-        tasks = [executor.execute_buy(req) for executor in self.executors]
+        tasks = [asyncio.create_task(executor.execute_buy(req)) for executor in self.executors]
         
-        # Wait for first successful result
-        for coro in asyncio.as_completed(tasks):
-            try:
-                result = await coro
+        try:
+            # Wait for first successful result; a failing provider only drops itself
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    result = await next_done
+                except Exception:
+                    continue
+                
                 if result.ok:
-                    # Cancel remaining tasks
-                    for task in tasks:
-                        if not task.done():
-                            task.cancel()
                     return result
-            except Exception:
-                continue
+        
+        finally:
+            # Cancel remaining tasks
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
         
         return ExecutionResult(
             ok=False,
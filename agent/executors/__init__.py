@@ -5,12 +5,15 @@ This package contains concrete implementations of TransactionExecutor
 for various DEX aggregators and trading APIs.
 """
 
-from .photon import PhotonExecutor
+from .photon import PhotonExecutor, close_photon_session
 from .gmgn import GmgnExecutor
 from .auto import AutoExecutor
+from ._rpc_pool import close_rpc_clients
 
 __all__ = [
     "PhotonExecutor",
     "GmgnExecutor", 
     "AutoExecutor",
+    "close_rpc_clients",
+    "close_photon_session",
 ]
@@ -0,0 +1,22 @@
+"""
+Base64 decoding for the swap transactions returned by aggregator APIs.
+
+pybase64's SIMD decoder is used when it is installed; otherwise the
+stdlib binascii decoder (which reads the str without an ASCII copy).
+"""
+
+from __future__ import annotations
+
+import binascii
+
+try:
+    import pybase64
+except ImportError:  # pybase64 is optional
+    pybase64 = None
+
+
+def decode_tx_b64(tx_b64: str) -> bytes:
+    """Decode a base64 transaction payload to raw bytes (non-strict, like b64decode)."""
+    if pybase64 is not None:
+        return pybase64.b64decode(tx_b64, validate=False)
+    return binascii.a2b_base64(tx_b64)
@@ -0,0 +1,154 @@
+"""
+Response parsing helpers for the GMGN executor.
+
+These are pure, fully-annotated functions with no I/O or pydantic models,
+so they can be compiled ahead of time (e.g. with mypyc) independently of
+the async request code in `gmgn.py`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class ParsedQuote:
+    """Pricing fields extracted from the best GMGN route."""
+    route_id: Optional[str]
+    price_usd: Optional[float]
+    amount_out: Optional[int]
+    impact_bps: Optional[int]
+    fee_usd: Optional[float]
+    best_route: Dict[str, Any]
+
+
+def parse_quote_response(status: int, data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize a GMGN quote response.
+    
+    Args:
+        status: HTTP status code
+        data: Decoded JSON body
+    
+    Returns:
+        Dict with `success` and either `routes` or `error`, plus the raw body
+    """
+    if status != 200:
+        return {
+            "success": False,
+            "error": f"Quote failed: {status} - {data.get('error', 'Unknown error')}",
+            "raw": data
+        }
+    
+    # GMGN typically uses code=0 for success
+    if data.get("code") != 0:
+        return {
+            "success": False,
+            "error": f"GMGN API error: {data.get('msg', 'Unknown error')}",
+            "raw": data
+        }
+    
+    payload: Dict[str, Any] = data.get("data", {})
+    return {
+        "success": True,
+        "routes": payload.get("routes", [payload]),  # Handle both formats
+        "raw": data
+    }
+
+
+def parse_swap_response(status: int, data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize a GMGN swap-build response.
+    
+    Args:
+        status: HTTP status code
+        data: Decoded JSON body
+    
+    Returns:
+        Dict with `success` and either `transaction` or `error`, plus the raw body
+    """
+    if status != 200:
+        return {
+            "success": False,
+            "error": f"Swap build failed: {status} - {data.get('error', 'Unknown error')}",
+            "raw": data
+        }
+    
+    if data.get("code") != 0:
+        return {
+            "success": False,
+            "error": f"GMGN swap error: {data.get('msg', 'Unknown error')}",
+            "raw": data
+        }
+    
+    swap_data: Dict[str, Any] = data.get("data", {})
+    return {
+        "success": True,
+        "transaction": swap_data.get("transaction") or swap_data.get("tx"),
+        "raw": data
+    }
+
+
+def to_bps(value: Any) -> Optional[int]:
+    """
+    Convert a fractional price impact (e.g. "0.0123") to basis points.
+    
+    Plain decimal strings are parsed digit by digit, so the conversion is
+    exact and truncates like `int()`; numbers and exponent notation fall
+    back to float math.
+    
+    Args:
+        value: Impact as a fraction, either numeric or string
+    
+    Returns:
+        Impact in basis points, or None if the value is missing/zero-valued
+    """
+    if not value:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value * 10000)
+    
+    text = str(value).strip()
+    negative = text.startswith("-")
+    if text[:1] in "+-":
+        text = text[1:]
+    
+    whole, _, frac = text.partition(".")
+    digits = whole + frac
+    if not digits or not digits.isdecimal():
+        return int(float(value) * 10000)
+    
+    bps = int(whole or "0") * 10000 + int((frac + "0000")[:4])
+    return -bps if negative else bps
+
+
+def _route_out_amount(route: Dict[str, Any]) -> int:
+    return int(route.get("outAmount", 0))
+
+
+def parse_best_route(routes: List[Dict[str, Any]]) -> ParsedQuote:
+    """
+    Pick the route with the highest output amount and extract its pricing.
+    
+    Args:
+        routes: Non-empty list of GMGN route dicts
+    
+    Returns:
+        ParsedQuote for the best route
+    """
+    best_route = max(routes, key=_route_out_amount)
+    
+    price_usd = best_route.get("priceUsd")
+    amount_out = best_route.get("outAmount")
+    impact_bps = best_route.get("priceImpact")
+    fee_usd = best_route.get("fee")
+    
+    return ParsedQuote(
+        route_id=best_route.get("routeId") or best_route.get("id"),
+        price_usd=float(price_usd) if price_usd else None,
+        amount_out=int(amount_out) if amount_out else None,
+        impact_bps=to_bps(impact_bps),
+        fee_usd=float(fee_usd) if fee_usd else None,
+        best_route=best_route
+    )
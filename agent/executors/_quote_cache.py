@@ -0,0 +1,94 @@
+"""
+Short-lived quote cache shared by the aggregator executors.
+
+Successful quotes are kept for a few hundred milliseconds, keyed by pair,
+exact input amount and slippage, so polling the same request skips the
+round-trip. Concurrent requests for one key share a single fetch. Every
+caller gets its own copy of the result; copies served from the cache are
+marked `cached` in their raw data.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from agent.executor_base import QuoteRequest, QuoteResult
+
+
+QuoteKey = Tuple[str, str, int, int]
+
+# Upper bound on cached quotes per executor (least recently used evicted first)
+QUOTE_CACHE_MAX_ENTRIES = 1024
+
+
+def quote_cache_key(req: QuoteRequest) -> QuoteKey:
+    """Key a quote by pair, exact input amount and slippage."""
+    return (req.token_in_mint, req.token_out_mint, req.amount_in_atomic, req.slippage_bps)
+
+
+class QuoteCache:
+    """TTL + LRU cache of successful quotes with single-flight fetches."""
+    
+    __slots__ = ("ttl", "_entries", "_inflight")
+    
+    def __init__(self, ttl: float):
+        """
+        Args:
+            ttl: Seconds a successful quote is served from cache (0 disables)
+        """
+        self.ttl = ttl
+        self._entries: OrderedDict[QuoteKey, Tuple[float, QuoteResult]] = OrderedDict()
+        self._inflight: Dict[QuoteKey, asyncio.Future] = {}
+    
+    def get(self, key: QuoteKey) -> Optional[QuoteResult]:
+        """Return a copy of a still-fresh cached quote, marked `cached`, if any."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        cached_at, result = entry
+        if time.monotonic() - cached_at >= self.ttl:
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return result.model_copy(update={"raw": {**(result.raw or {}), "cached": True}})
+    
+    def store(self, key: QuoteKey, result: QuoteResult) -> None:
+        """Cache a successful quote, evicting the least recently used entry when full."""
+        if self.ttl <= 0 or not result.ok:
+            return
+        
+        self._entries[key] = (time.monotonic(), result)
+        self._entries.move_to_end(key)
+        if len(self._entries) > QUOTE_CACHE_MAX_ENTRIES:
+            self._entries.popitem(last=False)
+    
+    async def get_or_fetch(self, key: QuoteKey, fetch: Callable[[], Awaitable[QuoteResult]]) -> QuoteResult:
+        """
+        Return the cached quote for `key`, or await `fetch()` and cache its result.
+        
+        Concurrent callers for the same key share one in-flight fetch. The
+        stored result is never handed out; each caller gets a copy.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_store(key, fetch))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shielded so one caller being cancelled doesn't cancel the shared fetch
+        result = await asyncio.shield(task)
+        return result.model_copy()
+    
+    async def _fetch_and_store(self, key: QuoteKey, fetch: Callable[[], Awaitable[QuoteResult]]) -> QuoteResult:
+        result = await fetch()
+        self.store(key, result)
+        return result
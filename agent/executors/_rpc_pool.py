@@ -0,0 +1,30 @@
+"""
+Process-wide pool of Solana RPC clients.
+
+Executors pointed at the same RPC endpoint share one AsyncClient, and with
+it one warm HTTP connection pool, instead of each opening their own.
+"""
+
+from typing import Dict
+
+from solana.rpc.async_api import AsyncClient
+
+
+_RPC_CLIENTS: Dict[str, AsyncClient] = {}
+
+
+def get_rpc_client(rpc_url: str) -> AsyncClient:
+    """Return the shared AsyncClient for an RPC endpoint, creating it on first use."""
+    client = _RPC_CLIENTS.get(rpc_url)
+    if client is None:
+        client = _RPC_CLIENTS[rpc_url] = AsyncClient(rpc_url)
+    return client
+
+
+async def close_rpc_clients() -> None:
+    """Close every shared RPC client. Call once at process shutdown."""
+    clients = list(_RPC_CLIENTS.values())
+    _RPC_CLIENTS.clear()
+    
+    for client in clients:
+        await client.close()
@@ -181,24 +181,31 @@ class AutoExecutor(MultiExecutor):
         """Update provider health status if enough time has passed."""
         current_time = asyncio.get_event_loop().time()
         
-        for executor in self.executors:
-            last_check = self._last_health_check.get(executor.name, 0)
+        stale_executors = [
+            executor for executor in self.executors
+            if current_time - self._last_health_check.get(executor.name, 0) > self.health_check_interval
+        ]
+        
+        # Checks are independent, so run them together instead of stacking
+        # each provider's round-trip in front of the order
+        await asyncio.gather(*(self._refresh_provider_health(executor, current_time) for executor in stale_executors))
+    
+    async def _refresh_provider_health(self, executor: TransactionExecutor, current_time: float):
+        """Run one provider's health check and record the outcome."""
+        try:
+            healthy = await executor.health_check()
+            self._provider_health[executor.name] = healthy
+            self._last_health_check[executor.name] = current_time
             
-            if current_time - last_check > self.health_check_interval:
-                try:
-                    healthy = await executor.health_check()
-                    self._provider_health[executor.name] = healthy
-                    self._last_health_check[executor.name] = current_time
-                    
-                    if healthy:
-                        self.logger.debug(f"Provider {executor.name} is healthy")
-                    else:
-                        self.logger.warning(f"Provider {executor.name} is unhealthy")
-                
-                except Exception as e:
-                    self.logger.error(f"Health check failed for {executor.name}: {e}")
-                    self._provider_health[executor.name] = False
-                    self._last_health_check[executor.name] = current_time
+            if healthy:
+                self.logger.debug(f"Provider {executor.name} is healthy")
+            else:
+                self.logger.warning(f"Provider {executor.name} is unhealthy")
+        
+        except Exception as e:
+            self.logger.error(f"Health check failed for {executor.name}: {e}")
+            self._provider_health[executor.name] = False
+            self._last_health_check[executor.name] = current_time
     
     async def get_provider_status(self) -> Dict[str, Any]:
         """Get detailed status of all providers."""
@@ -7,10 +7,13 @@ based on their official documentation at https://docs.gmgn.ai/
 
 from __future__ import annotations
 
-import base64
+import asyncio
 import os
+import random
 import time
-from typing import Any, Dict, Optional, List
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Dict, Optional, List, Set, Tuple, cast
 from datetime import datetime, timezone
 
 import aiohttp
@@ -23,12 +26,67 @@ import base58
 
 from agent.executor_base import TransactionExecutor, ExecutionRequest, ExecutionResult, QuoteRequest, QuoteResult
 from agent.tx_logger import TxLogger, get_logger
+from ._codec import decode_tx_b64
+from ._quote_cache import QuoteCache, quote_cache_key
+from ._rpc_pool import get_rpc_client
+from ._gmgn_parse import parse_best_route, parse_quote_response, parse_swap_response
 
 
 # GMGN API configuration
 GMGN_BASE_URL = "https://gmgn.ai/defi/quotev2"  # Based on their docs
 GMGN_SWAP_URL = "https://gmgn.ai/defi/swapv2"
 
+# Ceiling on a single 429 backoff, whatever Retry-After asks for
+MAX_RETRY_DELAY_SEC = 10.0
+
+
+class _UnopenedSession:
+    """
+    Placeholder for the HTTP session before `_ensure_clients` has run.
+    
+    Keeps `GmgnExecutor._session` non-optional so request paths don't need
+    to re-check it; any request issued through it fails loudly instead.
+    """
+    
+    def _not_open(self, *args: Any, **kwargs: Any) -> Any:
+        raise RuntimeError("HTTP session not initialized")
+    
+    get = post = _not_open
+
+
+_UNOPENED_SESSION = cast(aiohttp.ClientSession, _UnopenedSession())
+
+
+class _TokenBucket:
+    """Minimal token bucket used to budget outgoing API requests."""
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Tokens refilled per second
+            capacity: Maximum burst size (defaults to one second's worth)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+    
+    def try_acquire(self) -> bool:
+        """Take one token if available, without waiting."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+    
+    async def acquire(self) -> None:
+        """Take one token, waiting for the bucket to refill if necessary."""
+        while not self.try_acquire():
+            await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
 
 class GmgnExecutor(TransactionExecutor):
     """
@@ -45,7 +103,12 @@ class GmgnExecutor(TransactionExecutor):
         api_key: Optional[str] = None,
         rpc_url: Optional[str] = None,
         logger: Optional[TxLogger] = None,
-        base_url: Optional[str] = None
+        base_url: Optional[str] = None,
+        max_rps: float = 10.0,
+        rate_limit_cooldown: float = 5.0,
+        quote_cache_ttl: float = 0.5,
+        rate_limit_retries: int = 3,
+        retry_backoff: float = 0.5
     ):
         """
         Initialize GMGN executor.
@@ -55,6 +118,11 @@ class GmgnExecutor(TransactionExecutor):
             rpc_url: Solana RPC URL (from env SOLANA_RPC if not provided)
             logger: Transaction logger instance
             base_url: Custom GMGN API base URL
+            max_rps: Local budget of GMGN API requests per second
+            rate_limit_cooldown: Seconds to stop quoting a pair after a 429
+            quote_cache_ttl: Seconds a successful quote is served from cache (0 disables)
+            rate_limit_retries: How many times a 429 response is retried
+            retry_backoff: Base delay in seconds for exponential 429 backoff
         """
         load_dotenv()
         
@@ -63,13 +131,38 @@ class GmgnExecutor(TransactionExecutor):
         self.base_url = base_url or os.getenv("GMGN_BASE", GMGN_BASE_URL)
         self.logger = logger or get_logger()
         
+        # Request headers never change per call, so build them once
+        auth_headers = {"x-api-key": self.api_key} if self.api_key else {}
+        self._get_headers = MappingProxyType({
+            "accept": "application/json",
+            "user-agent": "ModularTradingAgent/1.0",
+            **auth_headers
+        })
+        self._post_headers = MappingProxyType({
+            "content-type": "application/json",
+            "accept": "application/json",
+            "user-agent": "ModularTradingAgent/1.0",
+            **auth_headers
+        })
+        
         # HTTP session for connection pooling
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._session: aiohttp.ClientSession = _UNOPENED_SESSION
         self._own_session = False
         
-        # Solana client for transaction broadcasting
+        # Solana client for transaction broadcasting (shared per RPC URL)
         self._rpc_client: Optional[AsyncClient] = None
         
+        # Local prefilters so doomed quote requests never hit the network
+        self._bad_mints: Set[str] = set()
+        self._pair_cooldowns: Dict[Tuple[str, str], float] = {}
+        self._rate_bucket = _TokenBucket(max_rps)
+        self.rate_limit_cooldown = rate_limit_cooldown
+        self.rate_limit_retries = rate_limit_retries
+        self.retry_backoff = retry_backoff
+        
+        # Short-lived cache so re-quotes of the same request skip the round-trip
+        self._quote_cache = QuoteCache(quote_cache_ttl)
+        
         # Keypair for signing (optional - only needed if simulate_only=False)
         self._keypair: Optional[Keypair] = None
         secret_key_b58 = os.getenv("SOLANA_SECRET_KEY_B58")
@@ -82,23 +175,50 @@ class GmgnExecutor(TransactionExecutor):
     
     async def _ensure_clients(self):
         """Ensure HTTP session and RPC client are initialized."""
-        if self._session is None:
+        if self._session is _UNOPENED_SESSION:
             timeout = aiohttp.ClientTimeout(total=30)
             self._session = aiohttp.ClientSession(timeout=timeout)
             self._own_session = True
         
         if self._rpc_client is None:
-            self._rpc_client = AsyncClient(self.rpc_url)
+            self._rpc_client = get_rpc_client(self.rpc_url)
     
     async def _close_clients(self):
-        """Close HTTP session and RPC client."""
-        if self._rpc_client:
-            await self._rpc_client.close()
-            self._rpc_client = None
-            
-        if self._own_session and self._session:
+        """Close HTTP session and release the shared RPC client."""
+        # The RPC client is pooled across executors; close_rpc_clients() shuts it down
+        self._rpc_client = None
+        
+        if self._own_session and self._session is not _UNOPENED_SESSION:
             await self._session.close()
-            self._session = None
+            self._session = _UNOPENED_SESSION
+    
+    def blacklist_mint(self, mint: str) -> None:
+        """Stop requesting quotes for any pair involving this mint."""
+        self._bad_mints.add(mint)
+    
+    def _prefilter_quote(self, req: QuoteRequest) -> Optional[str]:
+        """Return a reason to drop the quote request locally, or None to send it."""
+        if req.token_in_mint in self._bad_mints or req.token_out_mint in self._bad_mints:
+            return "Token is blacklisted"
+        
+        pair = (req.token_in_mint, req.token_out_mint)
+        cooldown_until = self._pair_cooldowns.get(pair)
+        if cooldown_until is not None:
+            if time.monotonic() < cooldown_until:
+                return "Pair is cooling down after rate limit"
+            del self._pair_cooldowns[pair]
+        
+        if not self._rate_bucket.try_acquire():
+            return "Local rate budget exhausted"
+        
+        return None
+    
+    def _record_quote_rejection(self, req: QuoteRequest, data: Dict[str, Any]) -> None:
+        """Blacklist any request mint that a 4xx error message names explicitly."""
+        message = str(data.get("error") or data.get("msg") or "")
+        for mint in (req.token_in_mint, req.token_out_mint):
+            if mint in message:
+                self._bad_mints.add(mint)
     
     async def get_quote(self, req: QuoteRequest) -> QuoteResult:
         """
@@ -110,11 +230,24 @@ class GmgnExecutor(TransactionExecutor):
         Returns:
             QuoteResult with pricing information
         """
+        return await self._quote_cache.get_or_fetch(quote_cache_key(req), partial(self._fetch_quote, req))
+    
+    async def _fetch_quote(self, req: QuoteRequest) -> QuoteResult:
+        """Request a quote from GMGN (cached by `get_quote` on success)."""
+        skip_reason = self._prefilter_quote(req)
+        if skip_reason:
+            self.logger.debug(f"[{self.name}] Quote skipped: {skip_reason}")
+            return QuoteResult(ok=False, provider=self.name, error=skip_reason)
+        
         await self._ensure_clients()
         start_time = time.time()
         
+        # Dumped once and shared by the request and error logs
+        req_dump = req.model_dump()
+        request_ok = True
+        
         try:
-            self.logger.log_quote_request(self.name, req.model_dump())
+            self.logger.log_quote_request(self.name, req_dump)
             
             quote_data = await self._get_quote_data(req)
             
@@ -141,34 +274,28 @@ class GmgnExecutor(TransactionExecutor):
                 return result
             
             # Get the best route (highest output amount)
-            best_route = max(routes, key=lambda r: int(r.get("outAmount", 0)))
-            
-            price_usd = best_route.get("priceUsd")
-            amount_out = best_route.get("outAmount") 
-            route_id = best_route.get("routeId") or best_route.get("id")
-            impact_bps = best_route.get("priceImpact")
-            fee_usd = best_route.get("fee")
+            parsed = parse_best_route(routes)
             
             result = QuoteResult(
                 ok=True,
                 provider=self.name,
-                price_usd=float(price_usd) if price_usd else None,
-                amount_out=int(amount_out) if amount_out else None,
-                route_id=route_id,
-                impact_bps=int(float(impact_bps) * 10000) if impact_bps else None,  # Convert to bps
-                fee_usd=float(fee_usd) if fee_usd else None,
-                raw={"best_route": best_route, "all_routes": routes}
+                price_usd=parsed.price_usd,
+                amount_out=parsed.amount_out,
+                route_id=parsed.route_id,
+                impact_bps=parsed.impact_bps,
+                fee_usd=parsed.fee_usd,
+                raw={"best_route": parsed.best_route, "all_routes": routes}
             )
             
             self.logger.log_quote_result(result.model_dump())
             return result
         
-        except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
-            self.logger.log_performance(self.name, "quote", duration_ms, False)
-            
-            error_msg = f"Quote request failed: {type(e).__name__}: {e}"
-            self.logger.log_error(self.name, error_msg, {"request": req.model_dump()})
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            # Transport, timeout and malformed-payload errors become a failed quote;
+            # anything else is a bug and propagates to the caller
+            request_ok = False
+            error_msg = f"Quote request failed: {e!r}"
+            self.logger.log_error(self.name, error_msg, {"request": req_dump})
             
             return QuoteResult(
                 ok=False,
@@ -176,9 +303,14 @@ class GmgnExecutor(TransactionExecutor):
                 error=error_msg
             )
         
+        except BaseException:
+            request_ok = False
+            raise
+        
         finally:
+            # Single timing record per quote, flagged by whether the request raised
             duration_ms = int((time.time() - start_time) * 1000)
-            self.logger.log_performance(self.name, "quote", duration_ms, True)
+            self.logger.log_performance(self.name, "quote", duration_ms, request_ok)
     
     async def execute_buy(self, req: ExecutionRequest) -> ExecutionResult:
         """
@@ -192,12 +324,18 @@ class GmgnExecutor(TransactionExecutor):
         """
         await self._ensure_clients()
         start_time = time.time()
+        # One timestamp for every result of this call; only a broadcast result
+        # records its own, since that happens after the network round-trips
+        now_iso = datetime.fromtimestamp(start_time, timezone.utc).isoformat()
+        
+        # Dumped once and shared by the request and error logs
+        req_dump = req.model_dump()
         
         try:
-            self.logger.log_execution_request(self.name, req.model_dump())
+            self.logger.log_execution_request(self.name, req_dump)
             
-            # Step 1: Get quote/route
-            quote_req = QuoteRequest(
+            # Step 1: Get quote/route (fields come from the validated ExecutionRequest)
+            quote_req = QuoteRequest.model_construct(
                 token_in_mint=req.token_in_mint,
                 token_out_mint=req.token_out_mint,
                 amount_in_atomic=req.amount_in_atomic,
@@ -210,39 +348,44 @@ class GmgnExecutor(TransactionExecutor):
                     ok=False,
                     provider=self.name,
                     error=f"Quote failed: {quote_result.error}",
-                    timestamp=datetime.now(timezone.utc).isoformat(),
+                    timestamp=now_iso,
                     request_metadata=req.metadata
                 )
                 self.logger.log_execution_result(result.model_dump())
                 return result
             
+            route_id = quote_result.route_id
+            price_usd = quote_result.price_usd
+            amount_out = quote_result.amount_out
+            quote_raw = quote_result.raw
+            
             # Step 2: Check limit price if provided
-            if req.limit_price_usd and quote_result.price_usd:
-                if quote_result.price_usd > req.limit_price_usd:
-                    error = f"Price ${quote_result.price_usd} exceeds limit ${req.limit_price_usd}"
+            if req.limit_price_usd and price_usd:
+                if price_usd > req.limit_price_usd:
+                    error = f"Price ${price_usd} exceeds limit ${req.limit_price_usd}"
                     result = ExecutionResult(
                         ok=False,
                         provider=self.name,
                         error=error,
-                        price_usd=quote_result.price_usd,
-                        raw=quote_result.raw,
-                        timestamp=datetime.now(timezone.utc).isoformat(),
+                        price_usd=price_usd,
+                        raw=quote_raw,
+                        timestamp=now_iso,
                         request_metadata=req.metadata
                     )
                     self.logger.log_execution_result(result.model_dump())
                     return result
             
             # Step 3: Build transaction
-            swap_data = await self._build_swap_transaction(req, quote_result.route_id)
+            swap_data = await self._build_swap_transaction(req, route_id)
             
             if not swap_data.get("success", True):
                 result = ExecutionResult(
                     ok=False,
                     provider=self.name,
                     error=swap_data.get("error", "Failed to build transaction"),
-                    price_usd=quote_result.price_usd,
-                    raw={"quote": quote_result.raw, "swap": swap_data},
-                    timestamp=datetime.now(timezone.utc).isoformat(),
+                    price_usd=price_usd,
+                    raw={"quote": quote_raw, "swap": swap_data},
+                    timestamp=now_iso,
                     request_metadata=req.metadata
                 )
                 self.logger.log_execution_result(result.model_dump())
@@ -254,11 +397,11 @@ class GmgnExecutor(TransactionExecutor):
                 result = ExecutionResult(
                     ok=True,
                     provider=self.name,
-                    route_id=quote_result.route_id,
-                    price_usd=quote_result.price_usd,
-                    amount_out=quote_result.amount_out,
-                    raw={"quote": quote_result.raw, "swap": swap_data},
-                    timestamp=datetime.now(timezone.utc).isoformat(),
+                    route_id=route_id,
+                    price_usd=price_usd,
+                    amount_out=amount_out,
+                    raw={"quote": quote_raw, "swap": swap_data},
+                    timestamp=now_iso,
                     request_metadata=req.metadata
                 )
                 self.logger.log_execution_result(result.model_dump())
@@ -271,13 +414,13 @@ class GmgnExecutor(TransactionExecutor):
             result = ExecutionResult(
                 ok=True,
                 provider=self.name,
-                route_id=quote_result.route_id,
-                price_usd=quote_result.price_usd,
-                amount_out=quote_result.amount_out,
+                route_id=route_id,
+                price_usd=price_usd,
+                amount_out=amount_out,
                 tx_sig=tx_sig,
                 slot=slot,
                 execution_time_ms=duration_ms,
-                raw={"quote": quote_result.raw, "swap": swap_data},
+                raw={"quote": quote_raw, "swap": swap_data},
                 timestamp=datetime.now(timezone.utc).isoformat(),
                 request_metadata=req.metadata
             )
@@ -290,14 +433,14 @@ class GmgnExecutor(TransactionExecutor):
             self.logger.log_performance(self.name, "execute_buy", duration_ms, False)
             
             error_msg = f"Execution failed: {type(e).__name__}: {e}"
-            self.logger.log_error(self.name, error_msg, {"request": req.model_dump()})
+            self.logger.log_error(self.name, error_msg, {"request": req_dump})
             
             return ExecutionResult(
                 ok=False,
                 provider=self.name,
                 error=error_msg,
                 execution_time_ms=duration_ms,
-                timestamp=datetime.now(timezone.utc).isoformat(),
+                timestamp=now_iso,
                 request_metadata=req.metadata
             )
         
@@ -305,10 +448,59 @@ class GmgnExecutor(TransactionExecutor):
             # Keep clients open for reuse unless explicitly closed
             pass
     
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        prepaid: bool = False,
+        parse_json: bool = True,
+        **kwargs: Any
+    ) -> Tuple[int, Dict[str, Any]]:
+        """
+        Issue a GMGN API request under the rate limiter, retrying 429s.
+        
+        Rate-limited attempts back off exponentially with jitter, honouring
+        a numeric Retry-After header when GMGN sends one.
+        
+        Args:
+            method: "GET" or "POST"
+            url: Request URL
+            prepaid: Whether the caller already took a rate-limit token for the first attempt
+            parse_json: Whether to decode the response body
+            **kwargs: Passed through to the aiohttp request
+            
+        Returns:
+            Tuple of (status code, decoded body); the body is empty for a final 429
+            or when parse_json is False
+        """
+        send = self._session.get if method == "GET" else self._session.post
+        
+        for attempt in range(self.rate_limit_retries + 1):
+            if attempt or not prepaid:
+                await self._rate_bucket.acquire()
+            
+            async with send(url, **kwargs) as response:
+                if response.status != 429:
+                    data = await response.json() if parse_json else {}
+                    return response.status, data
+                
+                retry_after = response.headers.get("Retry-After")
+            
+            self.logger.log_rate_limit(self.name, {"status": 429, "attempt": attempt + 1, "retry_after": retry_after})
+            if attempt == self.rate_limit_retries:
+                break
+            
+            try:
+                delay = float(retry_after) if retry_after else self.retry_backoff * 2 ** attempt
+            except ValueError:
+                delay = self.retry_backoff * 2 ** attempt
+            delay = min(delay, MAX_RETRY_DELAY_SEC)
+            await asyncio.sleep(delay + random.uniform(0, delay))
+        
+        return 429, {}
+    
     async def _get_quote_data(self, req: QuoteRequest) -> Dict[str, Any]:
         """Get quote data from GMGN API."""
-        assert self._session is not None
-        
         # Build quote request parameters
         params = {
             "from": req.token_in_mint,
@@ -318,50 +510,27 @@ class GmgnExecutor(TransactionExecutor):
             "chain": "solana"
         }
         
-        headers = {
-            "accept": "application/json",
-            "user-agent": "ModularTradingAgent/1.0"
-        }
-        
-        if self.api_key:
-            headers["x-api-key"] = self.api_key
-        
         try:
-            async with self._session.get(
+            # get_quote's prefilter already took this request's rate-limit token
+            status, data = await self._request(
+                "GET",
                 self.base_url,
+                prepaid=True,
                 params=params,
-                headers=headers
-            ) as response:
-                
-                if response.status == 429:
-                    self.logger.log_rate_limit(self.name, {"status": response.status})
-                    return {
-                        "success": False,
-                        "error": "Rate limited by GMGN API"
-                    }
-                
-                data = await response.json()
-                
-                if response.status != 200:
-                    return {
-                        "success": False,
-                        "error": f"Quote failed: {response.status} - {data.get('error', 'Unknown error')}",
-                        "raw": data
-                    }
-                
-                # Handle GMGN response format
-                if data.get("code") != 0:  # GMGN typically uses code=0 for success
-                    return {
-                        "success": False,
-                        "error": f"GMGN API error: {data.get('msg', 'Unknown error')}",
-                        "raw": data
-                    }
-                
+                headers=self._get_headers
+            )
+            
+            if status == 429:
+                pair = (req.token_in_mint, req.token_out_mint)
+                self._pair_cooldowns[pair] = time.monotonic() + self.rate_limit_cooldown
                 return {
-                    "success": True,
-                    "routes": data.get("data", {}).get("routes", [data.get("data", {})]),  # Handle both formats
-                    "raw": data
+                    "success": False,
+                    "error": "Rate limited by GMGN API"
                 }
+            
+            if 400 <= status < 500:
+                self._record_quote_rejection(req, data)
+            return parse_quote_response(status, data)
         
         except Exception as e:
             return {
@@ -371,8 +540,6 @@ class GmgnExecutor(TransactionExecutor):
     
     async def _build_swap_transaction(self, req: ExecutionRequest, route_id: Optional[str]) -> Dict[str, Any]:
         """Build a swap transaction through GMGN's API."""
-        assert self._session is not None
-        
         # Build swap request payload
         payload = {
             "from": req.token_in_mint,
@@ -389,52 +556,21 @@ class GmgnExecutor(TransactionExecutor):
         if req.priority_fee_lamports > 0:
             payload["priorityFee"] = req.priority_fee_lamports
         
-        headers = {
-            "content-type": "application/json",
-            "accept": "application/json",
-            "user-agent": "ModularTradingAgent/1.0"
-        }
-        
-        if self.api_key:
-            headers["x-api-key"] = self.api_key
-        
         try:
-            async with self._session.post(
+            status, data = await self._request(
+                "POST",
                 GMGN_SWAP_URL,
                 json=payload,
-                headers=headers
-            ) as response:
-                
-                if response.status == 429:
-                    self.logger.log_rate_limit(self.name, {"status": response.status})
-                    return {
-                        "success": False,
-                        "error": "Rate limited by GMGN API"
-                    }
-                
-                data = await response.json()
-                
-                if response.status != 200:
-                    return {
-                        "success": False,
-                        "error": f"Swap build failed: {response.status} - {data.get('error', 'Unknown error')}",
-                        "raw": data
-                    }
-                
-                # Handle GMGN response format
-                if data.get("code") != 0:
-                    return {
-                        "success": False,
-                        "error": f"GMGN swap error: {data.get('msg', 'Unknown error')}",
-                        "raw": data
-                    }
-                
-                swap_data = data.get("data", {})
+                headers=self._post_headers
+            )
+            
+            if status == 429:
                 return {
-                    "success": True,
-                    "transaction": swap_data.get("transaction") or swap_data.get("tx"),
-                    "raw": data
+                    "success": False,
+                    "error": "Rate limited by GMGN API"
                 }
+            
+            return parse_swap_response(status, data)
         
         except Exception as e:
             return {
@@ -453,7 +589,7 @@ class GmgnExecutor(TransactionExecutor):
             raise ValueError("No transaction data in GMGN response")
         
         # Decode and reconstruct the transaction
-        tx_bytes = base64.b64decode(tx_b64)
+        tx_bytes = decode_tx_b64(tx_b64)
         vtx = VersionedTransaction.from_bytes(tx_bytes)
         
         # Sign the transaction
@@ -467,19 +603,22 @@ class GmgnExecutor(TransactionExecutor):
             max_retries=req.max_retries
         )
         
-        send_result = await self._rpc_client.send_raw_transaction(
-            bytes(vtx),
-            opts=send_opts
+        # Broadcast and fetch the current slot concurrently; the slot lookup
+        # does not depend on the send result, so there is no reason to pay
+        # for two sequential RPC round-trips
+        send_result, slot_result = await asyncio.gather(
+            self._rpc_client.send_raw_transaction(bytes(vtx), opts=send_opts),
+            self._rpc_client.get_slot(),
+            return_exceptions=True
         )
         
+        if isinstance(send_result, BaseException):
+            raise send_result
+        
         tx_sig = str(send_result.value)
         
-        # Get current slot
-        try:
-            slot_result = await self._rpc_client.get_slot()
-            slot = slot_result.value
-        except Exception:
-            slot = None
+        # Slot is informational only
+        slot = None if isinstance(slot_result, BaseException) else slot_result.value
         
         return tx_sig, slot
     
@@ -487,15 +626,6 @@ class GmgnExecutor(TransactionExecutor):
         """Check if GMGN API is healthy."""
         try:
             await self._ensure_clients()
-            assert self._session is not None
-            
-            headers = {
-                "accept": "application/json",
-                "user-agent": "ModularTradingAgent/1.0"
-            }
-            
-            if self.api_key:
-                headers["x-api-key"] = self.api_key
             
             # Use a simple quote request as health check
             params = {
@@ -506,20 +636,22 @@ class GmgnExecutor(TransactionExecutor):
                 "chain": "solana"
             }
             
-            async with self._session.get(
+            status, _ = await self._request(
+                "GET",
                 self.base_url,
+                parse_json=False,
                 params=params,
-                headers=headers
-            ) as response:
-                healthy = response.status == 200
-                
-                details = {
-                    "status_code": response.status,
-                    "response_time_ms": 0  # Could add timing if needed
-                }
-                
-                self.logger.log_health_check(self.name, healthy, details)
-                return healthy
+                headers=self._get_headers
+            )
+            healthy = status == 200
+            
+            details = {
+                "status_code": status,
+                "response_time_ms": 0  # Could add timing if needed
+            }
+            
+            self.logger.log_health_check(self.name, healthy, details)
+            return healthy
         
         except Exception as e:
             self.logger.log_health_check(self.name, False, {"error": str(e)})
@@ -7,22 +7,40 @@ based on their official documentation at https://photonnetwork.readthedocs.io/
 
 from __future__ import annotations
 
-import base64
+import asyncio
 import os
 import time
-from typing import Any, Dict, Optional
+import weakref
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 from datetime import datetime, timezone
 
 import aiohttp
+import orjson
 from dotenv import load_dotenv
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.types import TxOpts
+from solana.rpc.websocket_api import connect as ws_connect
 from solders.transaction import VersionedTransaction
 from solders.keypair import Keypair
 import base58
 
+try:
+    import httpx
+except ImportError:  # httpx is optional; HTTP/2 also needs the `h2` package (httpx[http2])
+    httpx = None
+
+try:
+    import h2  # noqa: F401  (imported by httpx when http2=True)
+except ImportError:  # without it httpx.AsyncClient(http2=True) raises ImportError
+    h2 = None
+
 from agent.executor_base import TransactionExecutor, ExecutionRequest, ExecutionResult, QuoteRequest, QuoteResult
 from agent.tx_logger import TxLogger, get_logger
+from ._codec import decode_tx_b64
+from ._quote_cache import QuoteCache, quote_cache_key
+from ._rpc_pool import get_rpc_client
 
 
 # Photon API configuration
@@ -31,6 +49,84 @@ PHOTON_QUOTE_URL = f"{PHOTON_BASE_URL}/quote"
 PHOTON_SWAP_URL = f"{PHOTON_BASE_URL}/swap"
 
 
+# HTTP session shared by every PhotonExecutor, so keep-alive connections
+# (and their TLS handshakes) are reused across instances
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_shared_session() -> aiohttp.ClientSession:
+    """Return the shared Photon HTTP session, creating it on first use in this event loop."""
+    global _shared_session, _shared_session_loop
+    
+    loop = asyncio.get_running_loop()
+    if _shared_session is None or _shared_session.closed or _shared_session_loop is not loop:
+        # aiohttp already enables TCP_NODELAY on every connection it opens
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True
+        )
+        timeout = aiohttp.ClientTimeout(total=30, sock_connect=5)
+        _shared_session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        _shared_session_loop = loop
+    
+    return _shared_session
+
+
+# Optional HTTP/2 client, shared the same way; one TLS connection multiplexes
+# concurrent quote/swap calls instead of opening one connection per call
+_shared_h2_client: Optional["httpx.AsyncClient"] = None
+_shared_h2_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_shared_h2_client() -> "httpx.AsyncClient":
+    """Return the shared HTTP/2 client, creating it on first use in this event loop."""
+    global _shared_h2_client, _shared_h2_client_loop
+    
+    loop = asyncio.get_running_loop()
+    if _shared_h2_client is None or _shared_h2_client.is_closed or _shared_h2_client_loop is not loop:
+        _shared_h2_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            timeout=10.0
+        )
+        _shared_h2_client_loop = loop
+    
+    return _shared_h2_client
+
+
+async def close_photon_session() -> None:
+    """Close the shared Photon HTTP session(s). Call once at process shutdown."""
+    global _shared_session, _shared_session_loop, _shared_h2_client, _shared_h2_client_loop
+    
+    if _shared_session is not None and not _shared_session.closed:
+        await _shared_session.close()
+    _shared_session = None
+    _shared_session_loop = None
+    
+    if _shared_h2_client is not None and not _shared_h2_client.is_closed:
+        await _shared_h2_client.aclose()
+    _shared_h2_client = None
+    _shared_h2_client_loop = None
+
+
+def _store_slot(executor_ref: "weakref.ref[PhotonExecutor]", slot: int) -> bool:
+    """Record `slot` on the executor if it is still alive; False once it has been collected."""
+    executor = executor_ref()
+    if executor is None:
+        return False
+    executor._cached_slot = slot
+    return True
+
+
+# Errors from the HTTP layer (or a malformed body) that turn into a failed quote
+_QUOTE_ERRORS: Tuple[type, ...] = (aiohttp.ClientError, asyncio.TimeoutError, ValueError)
+if httpx is not None:
+    _QUOTE_ERRORS += (httpx.HTTPError,)
+
+
 class PhotonExecutor(TransactionExecutor):
     """
     Photon DEX aggregator executor.
@@ -46,7 +142,11 @@ class PhotonExecutor(TransactionExecutor):
         api_key: Optional[str] = None,
         rpc_url: Optional[str] = None,
         logger: Optional[TxLogger] = None,
-        base_url: Optional[str] = None
+        base_url: Optional[str] = None,
+        slot_refresh_interval: float = 3.0,
+        quote_cache_ttl: float = 0.75,
+        http2: bool = False,
+        ws_url: Optional[str] = None
     ):
         """
         Initialize Photon executor.
@@ -56,21 +156,53 @@ class PhotonExecutor(TransactionExecutor):
             rpc_url: Solana RPC URL (from env SOLANA_RPC if not provided)  
             logger: Transaction logger instance
             base_url: Custom Photon API base URL
+            slot_refresh_interval: Seconds between slot polls when the slot stream is down
+            quote_cache_ttl: Seconds a successful quote is served from cache (0 disables)
+            http2: Send Photon API calls over a shared HTTP/2 httpx client (needs httpx[http2])
+            ws_url: Solana WebSocket URL for slot notifications (from env SOLANA_WS, else derived from rpc_url)
         """
         load_dotenv()
         
         self.api_key = api_key or os.getenv("PHOTON_API_KEY", "")
         self.rpc_url = rpc_url or os.getenv("SOLANA_RPC", "https://api.mainnet-beta.solana.com")
+        self.ws_url = ws_url or os.getenv("SOLANA_WS") or self.rpc_url.replace("http", "ws", 1)
         self.base_url = base_url or os.getenv("PHOTON_BASE", PHOTON_BASE_URL)
         self.logger = logger or get_logger()
         
-        # HTTP session for connection pooling
+        # Request headers and endpoints never change per call, so build them once
+        auth_headers = {"x-api-key": self.api_key} if self.api_key else {}
+        self._get_headers = MappingProxyType({"accept": "application/json", **auth_headers})
+        self._post_headers = MappingProxyType({
+            "content-type": "application/json",
+            "accept": "application/json",
+            **auth_headers
+        })
+        self._quote_url = f"{self.base_url}/quote"
+        self._swap_url = f"{self.base_url}/swap"
+        
+        # HTTP session for connection pooling (module-wide shared session by default)
         self._session: Optional[aiohttp.ClientSession] = None
         self._own_session = False
         
-        # Solana client for transaction broadcasting
+        # HTTP/2 transport, used instead of the aiohttp session when enabled
+        http2_available = httpx is not None and h2 is not None
+        if http2 and not http2_available:
+            self.logger.warning("http2=True but httpx[http2] (httpx and h2) is not installed; using aiohttp")
+        self._use_http2 = http2 and http2_available
+        self._h2_client: Optional["httpx.AsyncClient"] = None
+        
+        # Solana client for transaction broadcasting (shared per RPC URL)
         self._rpc_client: Optional[AsyncClient] = None
         
+        # Slot kept fresh in the background (pushed over WebSocket, polled as a
+        # fallback) so broadcasts don't wait on get_slot
+        self.slot_refresh_interval = slot_refresh_interval
+        self._cached_slot: Optional[int] = None
+        self._slot_task: Optional[asyncio.Task] = None
+        
+        # Short-lived quote cache so polling the same pair/size skips the round-trip
+        self._quote_cache = QuoteCache(quote_cache_ttl)
+        
         # Keypair for signing (optional - only needed if simulate_only=False)
         self._keypair: Optional[Keypair] = None
         secret_key_b58 = os.getenv("SOLANA_SECRET_KEY_B58")
@@ -83,23 +215,119 @@ class PhotonExecutor(TransactionExecutor):
     
     async def _ensure_clients(self):
         """Ensure HTTP session and RPC client are initialized."""
-        if self._session is None:
-            timeout = aiohttp.ClientTimeout(total=30)
-            self._session = aiohttp.ClientSession(timeout=timeout)
-            self._own_session = True
+        if self._use_http2:
+            if self._h2_client is None:
+                self._h2_client = _get_shared_h2_client()
+        elif self._session is None:
+            self._session = _get_shared_session()
         
         if self._rpc_client is None:
-            self._rpc_client = AsyncClient(self.rpc_url)
+            self._rpc_client = get_rpc_client(self.rpc_url)
+        
+        # Only executors that can broadcast need a live slot; started on first
+        # use and given only a weak reference, so it can't keep us alive
+        if self._keypair and self._slot_task is None:
+            self._slot_task = asyncio.create_task(self._refresh_slot_forever(weakref.ref(self)))
     
-    async def _close_clients(self):
-        """Close HTTP session and RPC client."""
-        if self._rpc_client:
-            await self._rpc_client.close()
-            self._rpc_client = None
+    @staticmethod
+    async def _refresh_slot_forever(executor_ref: "weakref.ref[PhotonExecutor]"):
+        """
+        Keep the executor's `_cached_slot` current.
+        
+        Slots are pushed over a `slotSubscribe` WebSocket stream. Whenever the
+        stream can't be opened or drops, the slot is polled once and the
+        stream is retried after `slot_refresh_interval` seconds.
+        
+        The executor is only referenced weakly between steps. An executor
+        dropped without `_close_clients` (or `async with`) is therefore still
+        collected, and this loop returns at its next slot update or poll.
+        """
+        while True:
+            executor = executor_ref()
+            if executor is None:
+                return
+            ws_url = executor.ws_url
+            rpc_client = executor._rpc_client
+            interval = executor.slot_refresh_interval
+            logger = executor.logger
+            name = executor.name
+            del executor
+            
+            try:
+                await PhotonExecutor._stream_slots(executor_ref, ws_url)
+            except Exception as e:
+                logger.debug(f"[{name}] Slot stream unavailable: {e}")
+            
+            try:
+                assert rpc_client is not None
+                slot_result = await rpc_client.get_slot()
+                if not _store_slot(executor_ref, slot_result.value):
+                    return
+            except Exception as e:
+                logger.debug(f"[{name}] Slot refresh failed: {e}")
+            
+            await asyncio.sleep(interval)
+    
+    @staticmethod
+    async def _stream_slots(executor_ref: "weakref.ref[PhotonExecutor]", ws_url: str):
+        """Update the executor's `_cached_slot` from slot notifications until the stream closes."""
+        async with ws_connect(ws_url) as websocket:
+            await websocket.slot_subscribe()
+            await websocket.recv()  # subscription confirmation
             
+            while True:
+                for message in await websocket.recv():
+                    if not _store_slot(executor_ref, message.result.slot):
+                        return
+    
+    async def _close_clients(self):
+        """Close HTTP session and release the shared RPC client."""
+        if self._slot_task:
+            self._slot_task.cancel()
+            try:
+                await self._slot_task
+            except asyncio.CancelledError:
+                pass
+            self._slot_task = None
+        
+        # The RPC client is pooled across executors; close_rpc_clients() shuts it down
+        self._rpc_client = None
+        
+        # The shared session outlives this executor; close_photon_session() shuts it down
         if self._own_session and self._session:
             await self._session.close()
-            self._session = None
+        self._session = None
+        self._h2_client = None
+    
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[bytes] = None
+    ) -> Tuple[int, bytes]:
+        """
+        Send a Photon API request over the configured transport.
+        
+        Args:
+            method: "GET" or "POST"
+            url: Request URL
+            headers: Request headers
+            params: Query string parameters
+            body: Pre-encoded request body
+        
+        Returns:
+            Tuple of (HTTP status, raw response body)
+        """
+        if self._h2_client is not None:
+            response = await self._h2_client.request(method, url, params=params, content=body, headers=headers)
+            return response.status_code, response.content
+        
+        assert self._session is not None
+        send = self._session.get if method == "GET" else self._session.post
+        async with send(url, params=params, data=body, headers=headers) as response:
+            return response.status, await response.read()
     
     async def get_quote(self, req: QuoteRequest) -> QuoteResult:
         """
@@ -111,11 +339,19 @@ class PhotonExecutor(TransactionExecutor):
         Returns:
             QuoteResult with pricing information
         """
+        return await self._quote_cache.get_or_fetch(quote_cache_key(req), partial(self._fetch_quote, req))
+    
+    async def _fetch_quote(self, req: QuoteRequest) -> QuoteResult:
+        """Request a quote from Photon (cached by `get_quote` on success)."""
         await self._ensure_clients()
         start_time = time.time()
         
+        # Dumped once and shared by the request and error logs
+        req_dump = req.model_dump()
+        request_ok = True
+        
         try:
-            self.logger.log_quote_request(self.name, req.model_dump())
+            self.logger.log_quote_request(self.name, req_dump)
             
             # Build quote request
             params = {
@@ -125,66 +361,57 @@ class PhotonExecutor(TransactionExecutor):
                 "slippageBps": req.slippage_bps,
             }
             
-            headers = {"accept": "application/json"}
-            if self.api_key:
-                headers["x-api-key"] = self.api_key
-            
             # Make quote request
-            assert self._session is not None
-            async with self._session.get(
-                f"{self.base_url}/quote",
-                params=params,
-                headers=headers
-            ) as response:
-                
-                if response.status == 429:
-                    self.logger.log_rate_limit(self.name, {"status": response.status})
-                    result = QuoteResult(
-                        ok=False,
-                        provider=self.name,
-                        error="Rate limited by Photon API"
-                    )
-                    self.logger.log_quote_result(result.model_dump())
-                    return result
-                
-                data = await response.json()
-                
-                if response.status != 200:
-                    error = f"Quote failed: {response.status} - {data.get('error', 'Unknown error')}"
-                    result = QuoteResult(
-                        ok=False,
-                        provider=self.name,
-                        error=error,
-                        raw=data
-                    )
-                    self.logger.log_quote_result(result.model_dump())
-                    return result
-                
-                # Parse successful response
-                price_usd = data.get("priceUsd")
-                amount_out = data.get("outAmount")
-                route_id = data.get("routeId") or data.get("quoteId")
-                impact_bps = data.get("priceImpact")
-                
+            status, body = await self._request("GET", self._quote_url, self._get_headers, params=params)
+            
+            if status == 429:
+                self.logger.log_rate_limit(self.name, {"status": status})
                 result = QuoteResult(
-                    ok=True,
+                    ok=False,
                     provider=self.name,
-                    price_usd=float(price_usd) if price_usd else None,
-                    amount_out=int(amount_out) if amount_out else None,
-                    route_id=route_id,
-                    impact_bps=int(float(impact_bps) * 10000) if impact_bps else None,  # Convert to bps
+                    error="Rate limited by Photon API"
+                )
+                self.logger.log_quote_result(result.model_dump())
+                return result
+            
+            data = orjson.loads(body)
+            
+            if status != 200:
+                error = f"Quote failed: {status} - {data.get('error', 'Unknown error')}"
+                result = QuoteResult(
+                    ok=False,
+                    provider=self.name,
+                    error=error,
                     raw=data
                 )
-                
                 self.logger.log_quote_result(result.model_dump())
                 return result
-        
-        except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
-            self.logger.log_performance(self.name, "quote", duration_ms, False)
             
-            error_msg = f"Quote request failed: {type(e).__name__}: {e}"
-            self.logger.log_error(self.name, error_msg, {"request": req.model_dump()})
+            # Parse successful response
+            price_usd = data.get("priceUsd")
+            amount_out = data.get("outAmount")
+            route_id = data.get("routeId") or data.get("quoteId")
+            impact_bps = data.get("priceImpact")
+            
+            result = QuoteResult(
+                ok=True,
+                provider=self.name,
+                price_usd=float(price_usd) if price_usd else None,
+                amount_out=int(amount_out) if amount_out else None,
+                route_id=route_id,
+                impact_bps=int(float(impact_bps) * 10000) if impact_bps else None,  # Convert to bps
+                raw=data
+            )
+            
+            self.logger.log_quote_result(result.model_dump())
+            return result
+        
+        except _QUOTE_ERRORS as e:
+            # Transport, timeout and malformed-payload errors become a failed quote;
+            # anything else is a bug and propagates to the caller
+            request_ok = False
+            error_msg = f"Quote request failed: {e!r}"
+            self.logger.log_error(self.name, error_msg, {"request": req_dump})
             
             return QuoteResult(
                 ok=False,
@@ -192,9 +419,14 @@ class PhotonExecutor(TransactionExecutor):
                 error=error_msg
             )
         
+        except BaseException:
+            request_ok = False
+            raise
+        
         finally:
+            # Single timing record per quote, flagged by whether the request raised
             duration_ms = int((time.time() - start_time) * 1000)
-            self.logger.log_performance(self.name, "quote", duration_ms, True)
+            self.logger.log_performance(self.name, "quote", duration_ms, request_ok)
     
     async def execute_buy(self, req: ExecutionRequest) -> ExecutionResult:
         """
@@ -208,9 +440,15 @@ class PhotonExecutor(TransactionExecutor):
         """
         await self._ensure_clients()
         start_time = time.time()
+        # One timestamp for every result of this call; only a broadcast result
+        # records its own, since that happens after the network round-trips
+        now_iso = datetime.fromtimestamp(start_time, timezone.utc).isoformat()
+        
+        # Dumped once and shared by the request and error logs
+        req_dump = req.model_dump()
         
         try:
-            self.logger.log_execution_request(self.name, req.model_dump())
+            self.logger.log_execution_request(self.name, req_dump)
             
             # Step 1: Build the swap transaction
             swap_data = await self._build_swap_transaction(req)
@@ -221,7 +459,7 @@ class PhotonExecutor(TransactionExecutor):
                     provider=self.name,
                     error=swap_data.get("error", "Failed to build transaction"),
                     raw=swap_data,
-                    timestamp=datetime.now(timezone.utc).isoformat(),
+                    timestamp=now_iso,
                     request_metadata=req.metadata
                 )
                 self.logger.log_execution_result(result.model_dump())
@@ -238,7 +476,7 @@ class PhotonExecutor(TransactionExecutor):
                         error=error,
                         price_usd=float(price_usd),
                         raw=swap_data,
-                        timestamp=datetime.now(timezone.utc).isoformat(),
+                        timestamp=now_iso,
                         request_metadata=req.metadata
                     )
                     self.logger.log_execution_result(result.model_dump())
@@ -254,7 +492,7 @@ class PhotonExecutor(TransactionExecutor):
                     price_usd=float(price_usd) if price_usd else None,
                     amount_out=int(swap_data.get("outAmount", 0)) if swap_data.get("outAmount") else None,
                     raw=swap_data,
-                    timestamp=datetime.now(timezone.utc).isoformat(),
+                    timestamp=now_iso,
                     request_metadata=req.metadata
                 )
                 self.logger.log_execution_result(result.model_dump())
@@ -286,14 +524,14 @@ class PhotonExecutor(TransactionExecutor):
             self.logger.log_performance(self.name, "execute_buy", duration_ms, False)
             
             error_msg = f"Execution failed: {type(e).__name__}: {e}"
-            self.logger.log_error(self.name, error_msg, {"request": req.model_dump()})
+            self.logger.log_error(self.name, error_msg, {"request": req_dump})
             
             return ExecutionResult(
                 ok=False,
                 provider=self.name,
                 error=error_msg,
                 execution_time_ms=duration_ms,
-                timestamp=datetime.now(timezone.utc).isoformat(),
+                timestamp=now_iso,
                 request_metadata=req.metadata
             )
         
@@ -303,8 +541,6 @@ class PhotonExecutor(TransactionExecutor):
     
     async def _build_swap_transaction(self, req: ExecutionRequest) -> Dict[str, Any]:
         """Build a swap transaction through Photon's API."""
-        assert self._session is not None
-        
         # Build swap request payload
         payload = {
             "inputMint": req.token_in_mint,
@@ -318,42 +554,29 @@ class PhotonExecutor(TransactionExecutor):
             "asLegacyTransaction": False,  # Use versioned transactions
         }
         
-        headers = {
-            "content-type": "application/json",
-            "accept": "application/json"
-        }
+        # Make swap request (body pre-encoded with orjson; content-type is in the POST headers)
+        status, body = await self._request("POST", self._swap_url, self._post_headers, body=orjson.dumps(payload))
+        data = orjson.loads(body)
         
-        if self.api_key:
-            headers["x-api-key"] = self.api_key
+        if status == 429:
+            self.logger.log_rate_limit(self.name, {"status": status})
+            return {
+                "success": False,
+                "error": "Rate limited by Photon API",
+                "raw": data
+            }
         
-        # Make swap request
-        async with self._session.post(
-            f"{self.base_url}/swap",
-            json=payload,
-            headers=headers
-        ) as response:
-            
-            data = await response.json()
-            
-            if response.status == 429:
-                self.logger.log_rate_limit(self.name, {"status": response.status})
-                return {
-                    "success": False,
-                    "error": "Rate limited by Photon API",
-                    "raw": data
-                }
-            
-            if response.status != 200:
-                return {
-                    "success": False,
-                    "error": f"Swap build failed: {response.status} - {data.get('error', 'Unknown error')}",
-                    "raw": data
-                }
-            
+        if status != 200:
             return {
-                "success": True,
-                **data
+                "success": False,
+                "error": f"Swap build failed: {status} - {data.get('error', 'Unknown error')}",
+                "raw": data
             }
+        
+        return {
+            "success": True,
+            **data
+        }
     
     async def _sign_and_send_transaction(self, swap_data: Dict[str, Any], req: ExecutionRequest) -> tuple[str, Optional[int]]:
         """Sign and broadcast the transaction."""
@@ -366,7 +589,7 @@ class PhotonExecutor(TransactionExecutor):
             raise ValueError("No transaction data in Photon response")
         
         # Decode and reconstruct the transaction
-        tx_bytes = base64.b64decode(tx_b64)
+        tx_bytes = decode_tx_b64(tx_b64)
         vtx = VersionedTransaction.from_bytes(tx_bytes)
         
         # Sign the transaction
@@ -387,12 +610,9 @@ class PhotonExecutor(TransactionExecutor):
         
         tx_sig = str(send_result.value)
         
-        # Get current slot
-        try:
-            slot_result = await self._rpc_client.get_slot()
-            slot = slot_result.value
-        except Exception:
-            slot = None
+        # Slot is informational only; serve the background-refreshed value
+        # (at most one refresh interval old) instead of another RPC round-trip
+        slot = self._cached_slot
         
         return tx_sig, slot
     
@@ -400,11 +620,6 @@ class PhotonExecutor(TransactionExecutor):
         """Check if Photon API is healthy."""
         try:
             await self._ensure_clients()
-            assert self._session is not None
-            
-            headers = {"accept": "application/json"}
-            if self.api_key:
-                headers["x-api-key"] = self.api_key
             
             # Use a simple quote request as health check
             params = {
@@ -414,20 +629,16 @@ class PhotonExecutor(TransactionExecutor):
                 "slippageBps": 100
             }
             
-            async with self._session.get(
-                f"{self.base_url}/quote",
-                params=params,
-                headers=headers
-            ) as response:
-                healthy = response.status == 200
-                
-                details = {
-                    "status_code": response.status,
-                    "response_time_ms": 0  # Could add timing if needed
-                }
-                
-                self.logger.log_health_check(self.name, healthy, details)
-                return healthy
+            status, _ = await self._request("GET", self._quote_url, self._get_headers, params=params)
+            healthy = status == 200
+            
+            details = {
+                "status_code": status,
+                "response_time_ms": 0  # Could add timing if needed
+            }
+            
+            self.logger.log_health_check(self.name, healthy, details)
+            return healthy
         
         except Exception as e:
             self.logger.log_health_check(self.name, False, {"error": str(e)})
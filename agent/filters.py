@@ -2,14 +2,34 @@
 Pre-trade filters to suppress low-quality signals.
 """
 
+import time
+from collections import deque
 from datetime import datetime
-from typing import List
+from typing import Deque, Dict, List, Optional
 from .base import PreTradeFilter, MarketSnapshot, Signal, Candle
 
 
+def _snapshot_key(candles: List[Candle]) -> tuple:
+    """
+    Identify a candle series for memoization.
+    
+    The list identity plus its length and newest candle change whenever the
+    series does (including in-place appends), so a matching key means the
+    previous result for that series is still valid.
+    """
+    if not candles:
+        return (id(candles), 0, None, None)
+    last = candles[-1]
+    return (id(candles), len(candles), last.ts, last.close)
+
+
 class BasicTimeFilter(PreTradeFilter):
     """Filter signals based on trading hours."""
 
+    __slots__ = ("start", "end", "_cached_hour", "_cached_until")
+
+    ignores_signal = True
+
     def __init__(self, start_hour_utc: int = 0, end_hour_utc: int = 24):
         """
         Initialize time filter.
@@ -20,16 +40,62 @@ class BasicTimeFilter(PreTradeFilter):
         """
         self.start = start_hour_utc
         self.end = end_hour_utc
+        
+        # UTC hour and the epoch second at which it next changes
+        self._cached_hour = 0
+        self._cached_until = 0.0
 
     def allow(self, snapshot: MarketSnapshot, signal: Signal) -> bool:
         """Allow trading only during specified hours."""
-        current_hour = datetime.utcnow().hour
-        return self.start <= current_hour < self.end
+        now = time.time()
+        if now >= self._cached_until:
+            self._cached_hour = time.gmtime(now).tm_hour
+            self._cached_until = (now // 3600 + 1) * 3600
+        return self.start <= self._cached_hour < self.end
+
+
+class _RollingReturns:
+    """
+    Population std of candle-to-candle returns over a sliding window.
+    
+    Returns are computed once as candles arrive; the std is recomputed from
+    the (lookback-sized) window on each push rather than kept as a running
+    add/remove update, so rounding never accumulates and a flat window has a
+    volatility of exactly 0.
+    """
+
+    __slots__ = ("window", "volatility", "last_ts", "last_close")
+
+    def __init__(self, size: int):
+        # None marks a pair skipped because the previous close was not positive
+        self.window: Deque[Optional[float]] = deque(maxlen=size)
+        self.volatility = 0.0
+        self.last_ts: Optional[datetime] = None
+        self.last_close: Optional[float] = None
+
+    def push(self, candle: Candle) -> None:
+        """Add the return from the previous close to this candle's close."""
+        prev_close = self.last_close
+        if prev_close is not None:
+            self.window.append((candle.close - prev_close) / prev_close if prev_close > 0 else None)
+            returns = [r for r in self.window if r is not None]
+            if returns:
+                mean = sum(returns) / len(returns)
+                self.volatility = (sum((r - mean) ** 2 for r in returns) / len(returns)) ** 0.5
+            else:
+                self.volatility = 0.0
+        
+        self.last_ts = candle.ts
+        self.last_close = candle.close
 
 
 class VolatilityFilter(PreTradeFilter):
     """Filter signals based on recent volatility."""
 
+    __slots__ = ("min_volatility", "lookback", "_memo", "_rolling")
+
+    always_allows_flat = True
+
     def __init__(self, min_volatility: float = 0.001, lookback: int = 20):
         """
         Initialize volatility filter.
@@ -40,48 +106,59 @@ class VolatilityFilter(PreTradeFilter):
         """
         self.min_volatility = min_volatility
         self.lookback = lookback
-
-    def _calculate_volatility(self, candles: List[Candle]) -> float:
-        """Calculate price volatility over the lookback period."""
-        if len(candles) < 2:
-            return 0.0
         
-        # Use recent candles up to lookback limit
-        recent_candles = candles[-self.lookback:] if len(candles) >= self.lookback else candles
+        # Last (snapshot key, volatility); every signal on a snapshot reuses it
+        self._memo: tuple = (None, 0.0)
         
-        if len(recent_candles) < 2:
-            return 0.0
-        
-        # Calculate returns and standard deviation
-        returns = []
-        for i in range(1, len(recent_candles)):
-            prev_close = recent_candles[i-1].close
-            curr_close = recent_candles[i].close
-            if prev_close > 0:
-                returns.append((curr_close - prev_close) / prev_close)
+        # Rolling return statistics per symbol, advanced as new candles arrive
+        self._rolling: Dict[str, _RollingReturns] = {}
+
+    def _resume_index(self, stats: _RollingReturns, candles: List[Candle]) -> Optional[int]:
+        """Index of the first candle after the one `stats` last saw, if it is in range."""
+        stop = max(len(candles) - 1 - self.lookback, -1)
+        for i in range(len(candles) - 1, stop, -1):
+            candle = candles[i]
+            if candle.ts == stats.last_ts and candle.close == stats.last_close:
+                return i + 1
+        return None
+
+    def _rolling_volatility(self, symbol: str, candles: List[Candle]) -> float:
+        """Volatility over the lookback window, updated incrementally per symbol."""
+        if self.lookback < 2 or len(candles) < 2:
+            return 0.0  # fewer than two closes in the window: no returns to measure
         
-        if not returns:
-            return 0.0
+        stats = self._rolling.get(symbol)
+        start = self._resume_index(stats, candles) if stats is not None else None
+        if start is None:
+            # First sight of this series (or it no longer continues): rebuild the window
+            stats = self._rolling[symbol] = _RollingReturns(self.lookback - 1)
+            start = max(len(candles) - self.lookback, 0)
         
-        # Simple standard deviation calculation
-        mean_return = sum(returns) / len(returns)
-        variance = sum((r - mean_return) ** 2 for r in returns) / len(returns)
-        volatility = variance ** 0.5
+        for i in range(start, len(candles)):
+            stats.push(candles[i])
         
-        return volatility
+        return stats.volatility
 
     def allow(self, snapshot: MarketSnapshot, signal: Signal) -> bool:
         """Allow signals only if volatility is above minimum threshold."""
         if signal.side == 'flat':
             return True  # Always allow flat signals
         
-        volatility = self._calculate_volatility(snapshot.candles)
+        key = _snapshot_key(snapshot.candles)
+        memo_key, volatility = self._memo
+        if memo_key != key:
+            volatility = self._rolling_volatility(snapshot.symbol, snapshot.candles)
+            self._memo = (key, volatility)
         return volatility >= self.min_volatility
 
 
 class TrendFilter(PreTradeFilter):
     """Filter signals based on overall trend direction."""
 
+    __slots__ = ("trend_window", "_memo")
+
+    always_allows_flat = True
+
     def __init__(self, trend_window: int = 50):
         """
         Initialize trend filter.
@@ -90,6 +167,9 @@ class TrendFilter(PreTradeFilter):
             trend_window: Number of candles to use for trend calculation
         """
         self.trend_window = trend_window
+        
+        # Last (snapshot key, trend); every signal on a snapshot reuses it
+        self._memo: tuple = (None, 'neutral')
 
     def _get_trend_direction(self, candles: List[Candle]) -> str:
         """
@@ -119,7 +199,11 @@ class TrendFilter(PreTradeFilter):
         if signal.side == 'flat':
             return True
         
-        trend = self._get_trend_direction(snapshot.candles)
+        key = _snapshot_key(snapshot.candles)
+        memo_key, trend = self._memo
+        if memo_key != key:
+            trend = self._get_trend_direction(snapshot.candles)
+            self._memo = (key, trend)
         
         # Allow buy signals in uptrend, sell signals in downtrend
         if trend == 'up' and signal.side == 'buy':
@@ -135,6 +219,10 @@ class TrendFilter(PreTradeFilter):
 class ConfidenceFilter(PreTradeFilter):
     """Filter signals based on minimum confidence threshold."""
 
+    __slots__ = ("min_confidence",)
+
+    always_allows_flat = True
+
     def __init__(self, min_confidence: float = 0.6):
         """
         Initialize confidence filter.
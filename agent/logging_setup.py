@@ -0,0 +1,54 @@
+"""
+Logging configuration for the command-line entry points.
+
+Log records are handed to a background thread through a queue, so the
+trading loop only pays for an enqueue while formatting and the stream write
+happen off the hot path.
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging(level: int = logging.INFO, fmt: str = LOG_FORMAT) -> QueueListener:
+    """
+    Route all logging through a QueueHandler drained by a QueueListener thread.
+
+    Replaces any handlers already attached to the root logger. Calling it again
+    only updates the level. The listener is stopped (and the queue flushed) at
+    interpreter exit.
+
+    Args:
+        level: Root logger level
+        fmt: Format string for the stream handler
+
+    Returns:
+        The running QueueListener
+    """
+    global _listener
+
+    if _listener is not None:
+        logging.getLogger().setLevel(level)
+        return _listener
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(fmt))
+
+    # The listener's handler does the real formatting; the queue side only
+    # merges args into the message so records are safe to hand across threads.
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=level, handlers=[queue_handler], force=True)
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _listener
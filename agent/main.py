@@ -7,27 +7,36 @@ trading, see agent.solana_main module.
 
 import argparse
 import logging
-from typing import List
+from typing import Callable, Dict, List, Optional
 
+from .cache import CachedMarketData
 from .data_provider import InMemoryMarketData
+from .base import SignalProcessor
 from .strategy import SmaCrossoverStrategy, RsiStrategy, ComboStrategy
 from .executor import PaperBroker
 from .filters import BasicTimeFilter, VolatilityFilter, TrendFilter, ConfidenceFilter
 from .risk_manager import RiskManager
 from .trading_agent import TradingAgent
+from .logging_setup import setup_logging
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-)
+# Setup logging (records are written by a background listener thread)
+setup_logging(logging.INFO)
 log = logging.getLogger("main")
 
+# Strategy name -> factory, for create_agent
+_STRATEGY_FACTORIES: Dict[str, Callable[[], SignalProcessor]] = {
+    "sma": lambda: SmaCrossoverStrategy(fast=10, slow=30, min_confidence=0.55),
+    "rsi": lambda: RsiStrategy(period=14, oversold=30, overbought=70),
+    "combo": lambda: ComboStrategy(fast=10, slow=30, rsi_period=14),
+}
+
 
 def create_agent(strategy_name: str = "sma", 
                  risk_equity: float = 50000.0,
                  risk_per_trade: float = 0.01,
-                 poll_seconds: int = 2) -> TradingAgent:
+                 poll_seconds: int = 5,
+                 poll_jitter_seconds: Optional[float] = None,
+                 cache_dir: Optional[str] = None) -> TradingAgent:
     """
     Factory function to create a TradingAgent with specified components.
     
@@ -36,20 +45,21 @@ def create_agent(strategy_name: str = "sma",
         risk_equity: Account equity for risk management
         risk_per_trade: Risk per trade as percentage (0.01 = 1%)
         poll_seconds: Polling interval for continuous mode
+        poll_jitter_seconds: Random +/- offset per wait (default: 10% of poll_seconds)
+        cache_dir: If set, cache snapshots per candle window under this directory
         
     Returns:
         Configured TradingAgent
     """
     # Create data provider
     data = InMemoryMarketData()
+    if cache_dir:
+        data = CachedMarketData(data, cache_dir=cache_dir)
     
     # Create strategy
-    if strategy_name.lower() == "sma":
-        strategy = SmaCrossoverStrategy(fast=10, slow=30, min_confidence=0.55)
-    elif strategy_name.lower() == "rsi":
-        strategy = RsiStrategy(period=14, oversold=30, overbought=70)
-    elif strategy_name.lower() == "combo":
-        strategy = ComboStrategy(fast=10, slow=30, rsi_period=14)
+    factory = _STRATEGY_FACTORIES.get(strategy_name.lower())
+    if factory is not None:
+        strategy = factory()
     else:
         log.warning(f"Unknown strategy '{strategy_name}', using SMA")
         strategy = SmaCrossoverStrategy()
@@ -67,15 +77,18 @@ def create_agent(strategy_name: str = "sma",
     # Create risk manager
     risk = RiskManager(account_equity=risk_equity, risk_per_trade=risk_per_trade)
     
-    # Create and return trading agent
-    return TradingAgent(
+    # Create trading agent and get first-call costs out of the way before trading
+    agent = TradingAgent(
         data=data,
         strategy=strategy,
         broker=broker,
         filters=filters,
         risk=risk,
         poll_seconds=poll_seconds,
+        poll_jitter_seconds=poll_jitter_seconds,
     )
+    agent.warmup()
+    return agent
 
 
 def run_demo(symbols: List[str] = None):
@@ -138,7 +151,7 @@ For Live Solana Token Trading:
     
     parser.add_argument(
         "--strategy", "-st", 
-        choices=["sma", "rsi", "combo"],
+        choices=list(_STRATEGY_FACTORIES),
         default="sma",
         help="Trading strategy to use (default: sma)"
     )
@@ -153,8 +166,15 @@ For Live Solana Token Trading:
     parser.add_argument(
         "--poll-seconds", "-p", 
         type=int, 
-        default=2,
-        help="Polling interval in seconds (default: 2)"
+        default=5,
+        help="Polling interval in seconds (default: 5)"
+    )
+    
+    parser.add_argument(
+        "--poll-jitter",
+        type=float,
+        default=None,
+        help="Random +/- seconds added to each poll wait (default: 10%% of poll interval)"
     )
     
     parser.add_argument(
@@ -168,7 +188,13 @@ For Live Solana Token Trading:
         "--risk-per-trade", "-r", 
         type=float, 
         default=0.01,
-        help="Risk per trade as percentage (default: 0.01 = 1%)"
+        help="Risk per trade as percentage (default: 0.01 = 1%%)"
+    )
+    
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Cache market snapshots per candle window in this directory (default: off)"
     )
     
     parser.add_argument(
@@ -214,20 +240,23 @@ For Live Solana Token Trading:
         strategy_name=args.strategy,
         risk_equity=args.risk_equity,
         risk_per_trade=args.risk_per_trade,
-        poll_seconds=args.poll_seconds
+        poll_seconds=args.poll_seconds,
+        poll_jitter_seconds=args.poll_jitter,
+        cache_dir=args.cache_dir
     )
     
-    log.info(f"🤖 Trading Agent Configuration:")
-    log.info(f"   Symbols: {', '.join(args.symbols)}")
-    log.info(f"   Strategy: {args.strategy}")
-    log.info(f"   Risk Equity: ${args.risk_equity:,.2f}")
-    log.info(f"   Risk Per Trade: {args.risk_per_trade:.2%}")
-    log.info(f"   Poll Interval: {args.poll_seconds}s")
+    if log.isEnabledFor(logging.INFO):
+        log.info("🤖 Trading Agent Configuration:")
+        log.info("   Symbols: %s", ", ".join(args.symbols))
+        log.info("   Strategy: %s", args.strategy)
+        log.info("   Risk Equity: $%s", f"{args.risk_equity:,.2f}")
+        log.info("   Risk Per Trade: %.2f%%", args.risk_per_trade * 100)
+        log.info("   Poll Interval: %ss", args.poll_seconds)
     
     if args.continuous:
         agent.run_continuous(args.symbols)
     else:
-        log.info(f"   Iterations: {args.iterations}")
+        log.info("   Iterations: %d", args.iterations)
         log.info("")
         agent.run_loop(args.symbols, args.iterations)
 
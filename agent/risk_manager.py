@@ -2,12 +2,39 @@
 Risk management utilities for position sizing and risk controls.
 """
 
-from typing import Dict, Any
+from typing import Any, Dict, List, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch sizing falls back to a loop
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; batch sizing uses plain NumPy without it
+    njit = None
+
+
+if njit is not None and np is not None:
+    # Compiled (or loaded from the on-disk cache) on the first batch, not at
+    # import; TradingAgent.warmup() triggers that ahead of live trading
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _position_sizes_kernel(max_risk_amount, entries, stops):
+        """Risk-based sizes for aligned entry/stop arrays, one parallel pass with no temporaries."""
+        sizes = np.empty(entries.shape[0], dtype=np.float64)
+        for i in prange(entries.shape[0]):
+            risk_per_unit = abs(entries[i] - stops[i])
+            sizes[i] = max(0.0, max_risk_amount / risk_per_unit) if risk_per_unit > 0.0 else 0.0
+        return sizes
+else:
+    _position_sizes_kernel = None
 
 
 class RiskManager:
     """Basic position sizing and risk controls."""
 
+    __slots__ = ("_equity", "_risk_per_trade", "_max_risk_amount", "_stats")
+
     def __init__(self, account_equity: float, risk_per_trade: float = 0.01):
         """
         Initialize risk manager.
@@ -16,8 +43,43 @@ class RiskManager:
             account_equity: total account value
             risk_per_trade: fraction of equity to risk per trade (e.g., 0.01 = 1%)
         """
-        self.equity = account_equity
-        self.risk_per_trade = risk_per_trade
+        self._stats: Dict[str, Any] = {}
+        self._equity = account_equity
+        self._risk_per_trade = risk_per_trade
+        self._refresh_risk_amount()
+
+    # equity and risk_per_trade are properties so the cached max risk amount
+    # and stats stay in sync however they are changed
+
+    @property
+    def equity(self) -> float:
+        return self._equity
+
+    @equity.setter
+    def equity(self, value: float) -> None:
+        self._equity = value
+        self._refresh_risk_amount()
+
+    @property
+    def risk_per_trade(self) -> float:
+        return self._risk_per_trade
+
+    @risk_per_trade.setter
+    def risk_per_trade(self, value: float) -> None:
+        self._risk_per_trade = value
+        self._refresh_risk_amount()
+
+    @property
+    def max_risk_amount(self) -> float:
+        """Amount of equity risked per trade (equity * risk_per_trade)."""
+        return self._max_risk_amount
+
+    def _refresh_risk_amount(self) -> None:
+        self._max_risk_amount = self._equity * self._risk_per_trade
+        stats = self._stats
+        stats["account_equity"] = self._equity
+        stats["risk_per_trade"] = self._risk_per_trade
+        stats["max_risk_amount"] = self._max_risk_amount
 
     def position_size(self, entry: float, stop: float) -> float:
         """
@@ -36,9 +98,41 @@ class RiskManager:
         if risk_per_unit <= 0:
             return 0.0
         
-        size = (self.equity * self.risk_per_trade) / risk_per_unit
+        size = self._max_risk_amount / risk_per_unit
         return max(0.0, size)
 
+    def position_sizes(self, entries: Sequence[float], stops: Sequence[float]) -> Union["np.ndarray", List[float]]:
+        """
+        Calculate position sizes for many (entry, stop) pairs in one pass.
+        
+        Same rule as `position_size`, vectorized with NumPy when available and
+        compiled to a parallel loop with Numba when that is installed too.
+        The scalar `position_size` stays plain Python: for a single pair,
+        calling into a compiled function costs about as much as the math.
+        
+        Args:
+            entries: Entry prices
+            stops: Stop loss prices, aligned with `entries`
+            
+        Returns:
+            Position sizes in units (ndarray with NumPy, otherwise a list)
+        """
+        if np is None:
+            return [self.position_size(entry, stop) for entry, stop in zip(entries, stops)]
+        
+        entries = np.asarray(entries, dtype=np.float64)
+        stops = np.asarray(stops, dtype=np.float64)
+        if _position_sizes_kernel is not None:
+            return _position_sizes_kernel(self._max_risk_amount, entries, stops)
+        
+        risk_per_unit = np.abs(entries - stops)
+        sizes = np.where(
+            risk_per_unit > 0,
+            self._max_risk_amount / np.maximum(risk_per_unit, 1e-12),
+            0.0,
+        )
+        return np.maximum(sizes, 0.0)
+
     def update_equity(self, new_equity: float) -> None:
         """Update account equity for position sizing calculations."""
         self.equity = new_equity
@@ -48,9 +142,10 @@ class RiskManager:
         self.risk_per_trade = max(0.0, min(1.0, risk))  # Clamp between 0 and 1
 
     def get_stats(self) -> Dict[str, Any]:
-        """Get current risk manager statistics."""
-        return {
-            "account_equity": self.equity,
-            "risk_per_trade": self.risk_per_trade,
-            "max_risk_amount": self.equity * self.risk_per_trade
-        }
+        """
+        Get current risk manager statistics.
+        
+        Returns a snapshot copy of the stats kept up to date on every equity or
+        risk change, so later updates don't alter what the caller holds.
+        """
+        return self._stats.copy()
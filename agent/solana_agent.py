@@ -7,17 +7,92 @@ from Dexscreener and execute trades based on live token data.
 
 import asyncio
 import logging
-import json
-from typing import List, Dict, Any, Optional
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, NamedTuple, Optional, Tuple
 from datetime import datetime, timedelta
 
-from agent.base import AsyncMarketDataProvider, SignalProcessor, TradeExecutor, PreTradeFilter, MarketSnapshot, Candle, Signal, OrderRequest
+from agent.base import AsyncMarketDataProvider, SignalProcessor, TradeExecutor, PreTradeFilter, MarketSnapshot, Candle, Signal, OrderRequest, OrderResult, filter_checks
 from agent.risk_manager import RiskManager
-from agent.types import TokenTick
+from agent.types import TokenTick, parse_tick
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # NumPy/Numba are optional; batches fall back to the per-tick check
+    np = None
+    njit = None
 
 # Setup logging
 log = logging.getLogger(__name__)
 
+# Passed to signal-independent filters, which run before the strategy
+_NO_SIGNAL = Signal(symbol="", side="flat", confidence=0.0)
+
+
+class _TokenState:
+    """Everything the streaming agent tracks for one token, behind a single dict entry."""
+
+    __slots__ = ("history", "last_price")
+
+    def __init__(self, max_history: int):
+        # Bounded deque: appending evicts the oldest candle instead of re-slicing a list
+        self.history: Deque[Candle] = deque(maxlen=max_history)
+        # Price of the last tick that passed the price-change check
+        self.last_price: Optional[float] = None
+
+
+class TickResult(NamedTuple):
+    """
+    Outcome of processing one tick.
+    
+    A tuple with named fields instead of a per-tick dict: one fixed-size
+    allocation and no key hashing when the streaming loop reads it back.
+    """
+    token: Optional[str] = None
+    signal: Optional[str] = None         # None for error entries
+    confidence: float = 0.0
+    price: Optional[float] = None
+    size: float = 0.0
+    executed: bool = False
+    order_id: Optional[str] = None
+    filtered: bool = False
+    filter: Optional[str] = None         # name of the blocking filter
+    reason: Optional[str] = None         # why an unfiltered signal was not executed
+    liquidity: Optional[float] = None
+    rpc_healthy: Optional[bool] = None
+    slot: Optional[int] = None
+    error: Optional[str] = None
+    tick_data: Optional[Dict[str, Any]] = None  # raw tick, kept for error entries
+
+
+def _changed_mask(last, cur, threshold):
+    """
+    Per-tick "moved enough" flags for aligned last/current price arrays.
+    
+    A NaN last price marks a token seen for the first time (always True);
+    a non-positive last price never passes, as in `_should_process_tick`.
+    Written for Numba; compiled below when it is installed.
+    """
+    out = np.empty(cur.shape[0], dtype=np.bool_)
+    for i in range(cur.shape[0]):
+        prev = last[i]
+        if np.isnan(prev):
+            out[i] = True
+        else:
+            out[i] = prev > 0.0 and abs(cur[i] - prev) >= threshold * prev
+    return out
+
+
+if njit is not None:
+    # Compiled (or loaded from the on-disk cache) on the first batch, not at
+    # import; SolanaStreamingAgent.warmup() triggers that ahead of streaming.
+    # No fastmath: it lets LLVM assume NaN never occurs, which folds the
+    # first-sight np.isnan check to False
+    _changed_mask = njit(cache=True)(_changed_mask)
+else:
+    _changed_mask = None
+
 
 class SolanaStreamingAgent:
     """
@@ -38,6 +113,8 @@ class SolanaStreamingAgent:
         filters: Optional[List[PreTradeFilter]] = None,
         risk_manager: Optional[RiskManager] = None,
         min_price_change_threshold: float = 0.001,  # Minimum price change to trigger signal generation
+        max_history: int = 200,
+        max_concurrent_orders: int = 4,
     ):
         """
         Initialize the Solana streaming agent.
@@ -49,26 +126,65 @@ class SolanaStreamingAgent:
             filters: Optional pre-trade filters
             risk_manager: Risk management for position sizing
             min_price_change_threshold: Minimum price change to process (reduces noise)
+            max_history: Candles of price history kept per token
+            max_concurrent_orders: Orders from one polling cycle placed in parallel at most
         """
         self.data_provider = data_provider
         self.strategy = strategy
         self.executor = executor
         self.filters = filters or []
+        post_signal_filters = [f for f in self.filters if not f.ignores_signal]
+        self._pre_signal_checks = filter_checks([f for f in self.filters if f.ignores_signal])
+        self._post_signal_checks = filter_checks(post_signal_filters)
+        # Post-signal filters that can still block a 'flat' signal (the rest always pass it)
+        self._flat_checks = filter_checks([f for f in post_signal_filters if not f.always_allows_flat])
         self.risk_manager = risk_manager
         self.min_price_change_threshold = min_price_change_threshold
+        self.max_history = max_history
+        self.max_concurrent_orders = max_concurrent_orders
         
-        # Track price history for creating MarketSnapshot objects
-        self._price_history: Dict[str, List[Candle]] = {}
-        self._last_prices: Dict[str, float] = {}
+        # Per-token price history and last processed price (one lookup per tick)
+        self._tokens: Dict[str, _TokenState] = {}
+        # Fallback candle time for ticks without a timestamp, refreshed once per batch
+        self._now = datetime.utcnow()
         
         log.info(f"Initialized SolanaStreamingAgent with {len(self.filters)} filters")
 
+    def warmup(self, lookback: int = 200) -> None:
+        """
+        Exercise the strategy, filters and risk sizing once on synthetic data.
+        
+        Call before streaming so lazy imports, first-call setup and JIT
+        compilation happen up front instead of on the first live batch.
+        Nothing is fetched or executed, and no token state is recorded.
+        Components that keep per-symbol state will hold a small entry for the
+        '__warmup__' symbol.
+        """
+        start = datetime.utcnow() - timedelta(hours=lookback)
+        candles = []
+        for i in range(lookback):
+            price = 100.0 + (i % 7) * 0.5  # small zig-zag so returns/RSI are non-degenerate
+            candles.append(Candle(ts=start + timedelta(hours=i), open=price, high=price,
+                                  low=price, close=price, volume=1.0))
+        snap = MarketSnapshot(symbol="__warmup__", candles=candles)
+        
+        self.strategy.generate(snap)
+        signal = Signal(snap.symbol, "buy", 1.0)
+        for filter_obj in self.filters:
+            filter_obj.allow(snap, signal)
+        
+        if self.risk_manager:
+            self.risk_manager.position_size(price, price * 0.985)
+        if _changed_mask is not None:
+            _changed_mask(np.array([np.nan, price]), np.array([price, price]), self.min_price_change_threshold)
+
     def _tick_to_candle(self, tick: TokenTick) -> Candle:
         """
         Convert a TokenTick to a Candle for strategy compatibility.
         
         Since ticks don't have OHLC data, we create a synthetic candle
-        where open = high = low = close = current price.
+        where open = high = low = close = current price. Ticks without a
+        timestamp get the time their batch started processing.
         
         Args:
             tick: TokenTick from data provider
@@ -78,43 +194,37 @@ class SolanaStreamingAgent:
         """
         price = tick.price_usd or 0.0
         volume = tick.volume_24h_usd or 0.0
-        timestamp = tick.timestamp or datetime.utcnow()
-        
-        return Candle(
-            ts=timestamp,
-            open=price,
-            high=price,
-            low=price,
-            close=price,
-            volume=volume
-        )
-
-    def _update_price_history(self, tick: TokenTick, max_history: int = 200) -> MarketSnapshot:
+        timestamp = tick.timestamp or self._now
+        
+        # Positional: (ts, open, high, low, close, volume), skips keyword matching per tick
+        return Candle(timestamp, price, price, price, price, volume)
+
+    def _token_state(self, token: str) -> _TokenState:
+        """State for `token`, created on first sight."""
+        state = self._tokens.get(token)
+        if state is None:
+            state = self._tokens[token] = _TokenState(self.max_history)
+        return state
+
+    def _update_price_history(self, tick: TokenTick) -> MarketSnapshot:
         """
         Update price history and create MarketSnapshot for the token.
         
+        The snapshot shares the token's history deque rather than copying it.
+        
         Args:
             tick: Latest token tick data
-            max_history: Maximum number of candles to keep in history
             
         Returns:
             MarketSnapshot with recent price history
         """
         token = tick.token
-        candle = self._tick_to_candle(tick)
-        
-        # Initialize history if needed
-        if token not in self._price_history:
-            self._price_history[token] = []
+        history = self._token_state(token).history
         
-        # Add new candle
-        self._price_history[token].append(candle)
+        # Add new candle; the deque drops the oldest once it is full
+        history.append(self._tick_to_candle(tick))
         
-        # Keep only recent history
-        if len(self._price_history[token]) > max_history:
-            self._price_history[token] = self._price_history[token][-max_history:]
-        
-        return MarketSnapshot(symbol=token, candles=self._price_history[token])
+        return MarketSnapshot(symbol=token, candles=history)
 
     def _should_process_tick(self, tick: TokenTick) -> bool:
         """
@@ -128,130 +238,250 @@ class SolanaStreamingAgent:
         Returns:
             True if tick should be processed
         """
-        if tick.price_usd is None:
-            return False
-            
-        token = tick.token
         current_price = tick.price_usd
+        if current_price is None:
+            return False
         
-        # Always process first tick for a token
-        if token not in self._last_prices:
-            self._last_prices[token] = current_price
-            return True
+        state = self._token_state(tick.token)
+        last_price = state.last_price
         
-        # Check if price change is significant enough
-        last_price = self._last_prices[token]
-        if last_price > 0:
-            price_change = abs(current_price - last_price) / last_price
-            if price_change >= self.min_price_change_threshold:
-                self._last_prices[token] = current_price
-                return True
+        # Always process first tick for a token; otherwise require a large
+        # enough relative move (compared as |change| >= threshold * last)
+        if last_price is None or (
+            last_price > 0 and abs(current_price - last_price) >= self.min_price_change_threshold * last_price
+        ):
+            state.last_price = current_price
+            return True
         
         return False
 
-    async def _process_tick(self, tick_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _should_process_ticks(self, ticks: List[TokenTick]) -> List[bool]:
+        """
+        Batched `_should_process_tick` with the same results and side effects.
+        
+        With Numba installed the price-change test for the whole batch runs in
+        one compiled kernel. Batches where a token repeats fall back to the
+        per-tick check, since each tick there depends on the one before it.
         """
-        Process a single tick and potentially generate/execute trades.
+        tokens = [tick.token for tick in ticks]
+        if _changed_mask is None or len(set(tokens)) != len(tokens):
+            return [self._should_process_tick(tick) for tick in ticks]
+        
+        priced = [i for i, tick in enumerate(ticks) if tick.price_usd is not None]
+        flags = [False] * len(ticks)
+        if not priced:
+            return flags
+        
+        states = [self._token_state(tokens[i]) for i in priced]
+        nan = float("nan")
+        last = np.array([nan if st.last_price is None else st.last_price for st in states], dtype=np.float64)
+        cur = np.array([ticks[i].price_usd for i in priced], dtype=np.float64)
+        mask = _changed_mask(last, cur, self.min_price_change_threshold)
+        
+        for j, i in enumerate(priced):
+            if mask[j]:
+                flags[i] = True
+                states[j].last_price = ticks[i].price_usd
+        return flags
+
+    def _evaluate_tick(self, tick: TokenTick) -> Tuple[TickResult, Optional[OrderRequest]]:
+        """
+        Generate, filter and size a signal for a tick that passed `_should_process_tick`.
         
         Args:
-            tick_data: Raw tick data dict from data provider
+            tick: Parsed token tick
             
         Returns:
-            Processing result summary or None
+            (result, order to place or None). When an order is returned the
+            result is completed with its fill by `_record_fill`.
         """
-        try:
-            # Parse tick data
-            tick = TokenTick(**tick_data)
-            
-            # Skip if not worth processing
-            if not self._should_process_tick(tick):
-                return None
-            
-            # Update price history and create snapshot
-            snapshot = self._update_price_history(tick)
-            
-            # Generate signal
-            signal = self.strategy.generate(snapshot)
-            
-            # Apply filters
-            for filter_obj in self.filters:
-                if not filter_obj.allow(snapshot, signal):
-                    log.debug(f"Signal for {tick.token} blocked by {filter_obj.__class__.__name__}")
-                    return {
-                        "token": tick.token,
-                        "signal": signal.side,
-                        "confidence": signal.confidence,
-                        "price": tick.price_usd,
-                        "filtered": True,
-                        "filter": filter_obj.__class__.__name__
-                    }
-            
-            # Only proceed if signal is actionable
-            if signal.side in ("buy", "sell"):
-                # Calculate position size using risk manager
-                size = 0.0
-                if self.risk_manager and tick.price_usd:
-                    # Simple position sizing: risk 1.5% below/above current price
-                    entry_price = tick.price_usd
-                    if signal.side == "buy":
-                        stop_price = entry_price * 0.985  # 1.5% below
-                    else:
-                        stop_price = entry_price * 1.015  # 1.5% above
-                    
-                    size = self.risk_manager.position_size(entry_price, stop_price)
+        # Update price history and create snapshot
+        snapshot = self._update_price_history(tick)
+        
+        # Filters that don't depend on the signal can veto before the strategy runs
+        for allow, filter_name in self._pre_signal_checks:
+            if not allow(snapshot, _NO_SIGNAL):
+                log.debug("Tick for %s blocked before signal generation by %s", tick.token, filter_name)
+                return TickResult(
+                    token=tick.token,
+                    signal=_NO_SIGNAL.side,
+                    confidence=_NO_SIGNAL.confidence,
+                    price=tick.price_usd,
+                    filtered=True,
+                    filter=filter_name
+                ), None
+        
+        # Generate signal
+        signal = self.strategy.generate(snapshot)
+        
+        # Apply filters
+        active_checks = self._flat_checks if signal.side == 'flat' else self._post_signal_checks
+        for allow, filter_name in active_checks:
+            if not allow(snapshot, signal):
+                log.debug("Signal for %s blocked by %s", tick.token, filter_name)
+                return TickResult(
+                    token=tick.token,
+                    signal=signal.side,
+                    confidence=signal.confidence,
+                    price=tick.price_usd,
+                    filtered=True,
+                    filter=filter_name
+                ), None
+        
+        # Only proceed if signal is actionable
+        if signal.side in ("buy", "sell"):
+            # Calculate position size using risk manager
+            size = 0.0
+            if self.risk_manager and tick.price_usd:
+                # Simple position sizing: risk 1.5% below/above current price
+                entry_price = tick.price_usd
+                if signal.side == "buy":
+                    stop_price = entry_price * 0.985  # 1.5% below
                 else:
-                    size = 100.0  # Default size if no risk manager
+                    stop_price = entry_price * 1.015  # 1.5% above
                 
-                if size > 0:
-                    # Create order request
-                    order = OrderRequest(
-                        symbol=tick.token,
-                        side=signal.side,
-                        size=size,
-                        order_type="market",
-                        meta={
-                            "confidence": signal.confidence,
-                            "price": tick.price_usd,
-                            "liquidity": tick.liquidity_usd,
-                            "volume_24h": tick.volume_24h_usd,
-                            "slot": tick.slot,
-                            "signal_meta": signal.meta
-                        }
-                    )
-                    
-                    # Execute order
-                    result = self.executor.place_order(order)
-                    
-                    return {
-                        "token": tick.token,
-                        "signal": signal.side,
+                size = self.risk_manager.position_size(entry_price, stop_price)
+            else:
+                size = 100.0  # Default size if no risk manager
+            
+            if size > 0:
+                # Create order request
+                order = OrderRequest(
+                    symbol=tick.token,
+                    side=signal.side,
+                    size=size,
+                    order_type="market",
+                    meta={
                         "confidence": signal.confidence,
                         "price": tick.price_usd,
-                        "size": size,
-                        "executed": result.ok,
-                        "order_id": result.order_id,
-                        "error": result.error,
                         "liquidity": tick.liquidity_usd,
-                        "rpc_healthy": tick.rpc_healthy,
-                        "slot": tick.slot
+                        "volume_24h": tick.volume_24h_usd,
+                        "slot": tick.slot,
+                        "signal_meta": signal.meta
                     }
+                )
+                
+                return TickResult(
+                    token=tick.token,
+                    signal=signal.side,
+                    confidence=signal.confidence,
+                    price=tick.price_usd,
+                    size=size,
+                    liquidity=tick.liquidity_usd,
+                    rpc_healthy=tick.rpc_healthy,
+                    slot=tick.slot
+                ), order
+        
+        # Flat signal or no execution
+        return TickResult(
+            token=tick.token,
+            signal=signal.side,
+            confidence=signal.confidence,
+            price=tick.price_usd,
+            executed=False,
+            reason="flat_signal" if signal.side == "flat" else "no_position_size"
+        ), None
+
+    @staticmethod
+    def _record_fill(summary: TickResult, result: OrderResult) -> TickResult:
+        """Return the tick result completed with its order's execution outcome."""
+        return summary._replace(executed=result.ok, order_id=result.order_id, error=result.error)
+
+    @staticmethod
+    def _error_result(error: BaseException, tick_data: Dict[str, Any]) -> TickResult:
+        """Log a tick processing error and build its result entry."""
+        log.error("Error processing tick: %s", error)
+        return TickResult(error=str(error), tick_data=tick_data)
+
+    async def _process_batch(self, batch: List[Dict[str, Any]]) -> List[Optional[TickResult]]:
+        """
+        Process one polling cycle's ticks together.
+        
+        Ticks are screened with one batched `_should_process_ticks` call and
+        signals are evaluated in order; the resulting orders are then placed
+        concurrently (at most `max_concurrent_orders` at a time) instead of one
+        after another.
+        
+        Args:
+            batch: Raw tick data dicts from the data provider
             
-            # Flat signal or no execution
-            return {
-                "token": tick.token,
-                "signal": signal.side,
-                "confidence": signal.confidence,
-                "price": tick.price_usd,
-                "executed": False,
-                "reason": "flat_signal" if signal.side == "flat" else "no_position_size"
-            }
+        Returns:
+            One entry per tick: its TickResult, an error entry if parsing,
+            evaluation or the order failed, or None if the tick was skipped
+        """
+        results: List[Optional[TickResult]] = [None] * len(batch)
+        self._now = datetime.utcnow()
+        
+        indices: List[int] = []
+        ticks: List[TokenTick] = []
+        for i, tick_data in enumerate(batch):
+            try:
+                ticks.append(parse_tick(tick_data))
+                indices.append(i)
+            except Exception as e:
+                results[i] = self._error_result(e, tick_data)
+        
+        pending: List[Tuple[int, OrderRequest]] = []
+        for i, tick, should_process in zip(indices, ticks, self._should_process_ticks(ticks)):
+            if not should_process:
+                continue
+            try:
+                results[i], order = self._evaluate_tick(tick)
+            except Exception as e:
+                results[i] = self._error_result(e, batch[i])
+                continue
+            if order is not None:
+                pending.append((i, order))
+        
+        if pending:
+            semaphore = asyncio.Semaphore(self.max_concurrent_orders)
             
-        except Exception as e:
-            log.error(f"Error processing tick: {e}")
-            return {
-                "error": str(e),
-                "tick_data": tick_data
-            }
+            async def place(order: OrderRequest) -> OrderResult:
+                async with semaphore:
+                    return await asyncio.to_thread(self.executor.place_order, order)
+            
+            fills = await asyncio.gather(*(place(order) for _, order in pending), return_exceptions=True)
+            for (i, _), fill in zip(pending, fills):
+                if isinstance(fill, Exception):
+                    results[i] = self._error_result(fill, batch[i])
+                elif isinstance(fill, BaseException):
+                    raise fill
+                else:
+                    results[i] = self._record_fill(results[i], fill)
+        
+        return results
+
+    async def _tick_batches(self, tokens: List[str], interval_sec: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Ticks grouped per polling cycle.
+        
+        Uses the provider's `subscribe_batches` when it has one; otherwise groups
+        every `len(tokens)` consecutive ticks from `subscribe_ticks`.
+        """
+        subscribe_batches = getattr(self.data_provider, "subscribe_batches", None)
+        if subscribe_batches is not None:
+            source = subscribe_batches(tokens, interval_sec)
+            try:
+                async for batch in source:
+                    yield batch
+            finally:
+                await source.aclose()
+            return
+        
+        source = self.data_provider.subscribe_ticks(tokens, interval_sec)
+        batch: List[Dict[str, Any]] = []
+        try:
+            async for tick_data in source:
+                batch.append(tick_data)
+                if len(batch) >= len(tokens):
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+        finally:
+            aclose = getattr(source, "aclose", None)
+            if aclose is not None:
+                await aclose()
 
     async def run_streaming(
         self, 
@@ -271,40 +501,47 @@ class SolanaStreamingAgent:
         log.info(f"Tokens: {', '.join(tokens)}")
         log.info(f"Interval: {interval_sec}s, Max duration: {max_duration_sec}s")
         
-        start_time = datetime.utcnow()
+        # Monotonic clock: the per-tick duration check is a float compare, no datetime math
+        start_time = time.monotonic()
+        deadline = start_time + max_duration_sec if max_duration_sec else None
         processed_count = 0
         executed_trades = 0
+        # Closed explicitly in `finally` so a `break` releases the provider's
+        # HTTP session right away rather than whenever the generator is collected
+        batches = self._tick_batches(tokens, interval_sec)
         
         try:
-            async for tick_data in self.data_provider.subscribe_ticks(tokens, interval_sec):
+            async for batch in batches:
                 # Check duration limit
-                if max_duration_sec:
-                    elapsed = (datetime.utcnow() - start_time).total_seconds()
-                    if elapsed >= max_duration_sec:
-                        log.info(f"Reached maximum duration of {max_duration_sec}s, stopping")
-                        break
+                if deadline is not None and time.monotonic() >= deadline:
+                    log.info("Reached maximum duration of %ss, stopping", max_duration_sec)
+                    break
                 
-                # Process the tick
-                result = await self._process_tick(tick_data)
-                if result:
+                # Process the polling cycle's ticks together
+                debug_enabled = log.isEnabledFor(logging.DEBUG)
+                for result in await self._process_batch(batch):
+                    if result is None:
+                        continue
                     processed_count += 1
                     
                     # Log interesting results
-                    if result.get("executed"):
+                    if result.executed:
                         executed_trades += 1
-                        log.info(f"💰 EXECUTED: {result['signal'].upper()} {result['token']} "
-                                f"${result['price']:.6f} size={result['size']:.2f} "
-                                f"conf={result['confidence']:.2%} id={result['order_id']}")
-                    elif result.get("filtered"):
-                        log.debug(f"🚫 FILTERED: {result['signal'].upper()} {result['token']} "
-                                 f"by {result['filter']}")
-                    elif result.get("signal") != "flat":
-                        log.debug(f"⏸️ SKIPPED: {result['signal'].upper()} {result['token']} "
-                                 f"${result['price']:.6f} - {result.get('reason', 'unknown')}")
+                        log.info("💰 EXECUTED: %s %s $%.6f size=%.2f conf=%.2f%% id=%s",
+                                 result.signal.upper(), result.token, result.price,
+                                 result.size, result.confidence * 100, result.order_id)
+                    elif debug_enabled:
+                        # Only build the debug arguments when they will be emitted
+                        if result.filtered:
+                            log.debug("🚫 FILTERED: %s %s by %s",
+                                      result.signal.upper(), result.token, result.filter)
+                        elif result.signal not in (None, "flat"):  # None: error entry, already logged
+                            log.debug("⏸️ SKIPPED: %s %s $%.6f - %s", result.signal.upper(), result.token,
+                                      result.price, result.reason or 'unknown')
                     
                     # Print summary every 50 ticks
                     if processed_count % 50 == 0:
-                        log.info(f"📊 Processed {processed_count} signals, executed {executed_trades} trades")
+                        log.info("📊 Processed %d signals, executed %d trades", processed_count, executed_trades)
                         
         except KeyboardInterrupt:
             log.info("\n🛑 Streaming agent stopped by user")
@@ -312,19 +549,24 @@ class SolanaStreamingAgent:
             log.error(f"💥 Unexpected error in streaming agent: {e}")
             raise
         finally:
+            await batches.aclose()
+            
             # Final summary
-            elapsed = (datetime.utcnow() - start_time).total_seconds()
+            elapsed = time.monotonic() - start_time
             log.info(f"\n📈 Final Summary:")
             log.info(f"   Runtime: {elapsed:.1f}s")
             log.info(f"   Signals processed: {processed_count}")
             log.info(f"   Trades executed: {executed_trades}")
-            log.info(f"   Success rate: {executed_trades/processed_count*100:.1f}%" if processed_count > 0 else "   No signals processed")
+            if processed_count > 0:
+                log.info("   Success rate: %.1f%%", executed_trades / processed_count * 100)
+            else:
+                log.info("   No signals processed")
 
     async def run_single_cycle(
         self, 
         tokens: List[str], 
         interval_sec: int = 10
-    ) -> List[Dict[str, Any]]:
+    ) -> List[TickResult]:
         """
         Run a single cycle of data fetching and processing.
         
@@ -340,15 +582,15 @@ class SolanaStreamingAgent:
         log.info(f"Running single cycle for {len(tokens)} tokens")
         results = []
         
-        # Get one batch of ticks
-        async for tick_data in self.data_provider.subscribe_ticks(tokens, interval_sec):
-            result = await self._process_tick(tick_data)
-            if result:
-                results.append(result)
-            
-            # Stop after getting data for all tokens
-            if len(results) >= len(tokens):
+        # Process exactly one batch of ticks; stopping there (even if some were
+        # skipped) keeps the provider from sleeping and fetching a second batch
+        batches = self._tick_batches(tokens, interval_sec)
+        try:
+            async for batch in batches:
+                results = [result for result in await self._process_batch(batch) if result is not None]
                 break
+        finally:
+            await batches.aclose()
         
         log.info(f"Single cycle completed: {len(results)} results")
         return results
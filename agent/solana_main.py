@@ -18,15 +18,19 @@ from agent.executor import PaperBroker
 from agent.filters import ConfidenceFilter, VolatilityFilter, BasicTimeFilter
 from agent.risk_manager import RiskManager
 from agent.solana_agent import SolanaStreamingAgent
+from agent.logging_setup import setup_logging
+from agent.cache import SharedTickProvider
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; fall back to the default asyncio loop
+    uvloop = None
 
 # Load environment variables
 load_dotenv()
 
-# Setup logging
-logging.basicConfig(
-    level=getattr(logging, os.getenv("LOG_LEVEL", "INFO")),
-    format="%(asctime)s | %(levelname)s | %(name)s | %(message)s"
-)
+# Setup logging (records are written by a background listener thread)
+setup_logging(getattr(logging, os.getenv("LOG_LEVEL", "INFO")))
 log = logging.getLogger(__name__)
 
 
@@ -60,7 +64,7 @@ def get_tokens_from_env() -> List[str]:
 
 
 async def run_solana_demo():
-    """Run a demo of the Solana streaming agent with multiple strategies."""
+    """Run a demo of the Solana streaming agent with multiple strategies side by side."""
     log.info("🚀 Starting Solana Trading Agent Demo")
     log.info("=" * 60)
     
@@ -68,9 +72,6 @@ async def run_solana_demo():
     tokens = get_tokens_from_env()
     log.info(f"Trading tokens: {tokens}")
     
-    # Create data provider
-    data_provider = DexScreenerSolanaProvider()
-    
     # Create strategies to test
     strategies = [
         ("SMA Crossover", SmaCrossoverStrategy(fast=5, slow=15, min_confidence=0.6)),
@@ -78,12 +79,8 @@ async def run_solana_demo():
         ("Combo Strategy", ComboStrategy(fast=5, slow=15, rsi_period=10))
     ]
     
-    # Test each strategy briefly
-    for strategy_name, strategy in strategies:
-        log.info(f"\n📊 Testing {strategy_name}")
-        log.info("-" * 40)
-        
-        # Create components
+    async def run_strategy(data_provider, strategy_name: str, strategy) -> None:
+        # Create components; each strategy has its own broker, filters and risk state
         executor = PaperBroker()
         filters = [
             ConfidenceFilter(min_confidence=0.5),
@@ -103,15 +100,24 @@ async def run_solana_demo():
             risk_manager=risk_manager,
             min_price_change_threshold=float(os.getenv("MIN_PRICE_CHANGE_THRESHOLD", "0.001"))
         )
+        agent.warmup()
         
         # Run for a short time (60 seconds)
         try:
             await agent.run_streaming(tokens, interval_sec=15, max_duration_sec=60)
         except Exception as e:
             log.error(f"Error running {strategy_name}: {e}")
+    
+    # Create data provider; the context keeps one HTTP session and RPC client open
+    # for the whole demo, and since every strategy reads the same polling cycles
+    # a single upstream subscription is shared by all of them
+    async with DexScreenerSolanaProvider() as dexscreener:
+        data_provider = SharedTickProvider(dexscreener)
         
-        # Small delay between strategies
-        await asyncio.sleep(2)
+        # Test all strategies concurrently
+        log.info(f"\n📊 Testing {', '.join(name for name, _ in strategies)}")
+        log.info("-" * 40)
+        await asyncio.gather(*(run_strategy(data_provider, name, strategy) for name, strategy in strategies))
     
     log.info("\n🎉 Demo completed!")
 
@@ -137,6 +143,7 @@ async def run_single_cycle():
         filters=filters,
         risk_manager=risk_manager
     )
+    agent.warmup()
     
     # Run single cycle
     results = await agent.run_single_cycle(tokens, interval_sec=10)
@@ -144,10 +151,10 @@ async def run_single_cycle():
     # Print results
     log.info(f"\\n📊 Single Cycle Results ({len(results)} tokens):")
     for result in results:
-        token = result.get("token", "Unknown")
-        signal = result.get("signal", "flat").upper()
-        price = result.get("price")
-        executed = result.get("executed", False)
+        token = result.token or "Unknown"
+        signal = (result.signal or "flat").upper()
+        price = result.price
+        executed = result.executed
         
         status = "✅ EXECUTED" if executed else "⏸️ SKIPPED"
         price_str = f"${price:.6f}" if price else "N/A"
@@ -184,6 +191,7 @@ async def run_continuous_trading(duration_minutes: int = 60):
         risk_manager=risk_manager,
         min_price_change_threshold=0.005  # Higher threshold for longer runs
     )
+    agent.warmup()
     
     # Run for specified duration
     await agent.run_streaming(
@@ -250,7 +258,8 @@ Examples:
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        # libuv-based loop: cheaper per-callback scheduling for the tick stream
+        (uvloop.run if uvloop is not None else asyncio.run)(main())
     except KeyboardInterrupt:
         log.info("\\n👋 Goodbye!")
     except Exception as e:
@@ -4,8 +4,37 @@ Trading strategies.
 This module contains concrete implementations of SignalProcessor.
 """
 
-from typing import List, Optional
-from .base import SignalProcessor, MarketSnapshot, Signal
+from abc import ABC, abstractmethod
+from collections import deque
+from datetime import datetime
+from functools import partial
+from types import MappingProxyType
+from typing import Deque, Dict, List, Optional
+from .base import SignalProcessor, MarketSnapshot, Signal, Candle
+
+
+# Constant metadata for recurring flat signals, shared instead of rebuilt per call
+_INSUFFICIENT_DATA_META = MappingProxyType({"reason": "insufficient_data"})
+_INSUFFICIENT_META = MappingProxyType({"reason": "insufficient"})
+_COMBO_FLAT_META = {
+    (sma_side, rsi_side): MappingProxyType({
+        "reason": "Signals disagree or both flat",
+        "sma_signal": sma_side,
+        "rsi_signal": rsi_side,
+    })
+    for sma_side in ("buy", "sell", "flat")
+    for rsi_side in ("buy", "sell", "flat")
+}
+# (SMA side, RSI side) -> which rule ComboStrategy applies; other pairs stay flat
+_COMBO_AGREE, _COMBO_SMA_ONLY, _COMBO_RSI_ONLY = range(3)
+_COMBO_RULES = {
+    ("buy", "buy"): _COMBO_AGREE,
+    ("sell", "sell"): _COMBO_AGREE,
+    ("buy", "flat"): _COMBO_SMA_ONLY,
+    ("sell", "flat"): _COMBO_SMA_ONLY,
+    ("flat", "buy"): _COMBO_RSI_ONLY,
+    ("flat", "sell"): _COMBO_RSI_ONLY,
+}
 
 
 def sma(values: List[float], window: int) -> List[Optional[float]]:
@@ -23,6 +52,166 @@ def sma(values: List[float], window: int) -> List[Optional[float]]:
     return out
 
 
+class _RollingCloses(ABC):
+    """
+    The most recent closes of one symbol plus statistics over them.
+    
+    Strategies keep one per symbol and push each new close, so a signal only
+    looks at the short window it needs instead of the whole history.
+    Subclasses update their statistics in `_on_push`.
+    """
+
+    __slots__ = ("window", "last_ts", "last_close")
+
+    def __init__(self, size: int):
+        self.window: Deque[float] = deque(maxlen=size)
+        self.last_ts: Optional[datetime] = None
+        self.last_close: Optional[float] = None
+
+    @abstractmethod
+    def _on_push(self) -> None:
+        """Update the statistics after a close has been appended to `window`."""
+        raise NotImplementedError
+
+    def push(self, candle: Candle) -> None:
+        """Add this candle's close, dropping the oldest one once the window is full."""
+        self.window.append(candle.close)
+        self.last_ts = candle.ts
+        self.last_close = candle.close
+        self._on_push()
+
+    def resume_index(self, candles: List[Candle]) -> Optional[int]:
+        """Index of the first candle after the one last pushed, if it is recent enough."""
+        stop = max(len(candles) - 1 - (self.window.maxlen or 0), -1)
+        for i in range(len(candles) - 1, stop, -1):
+            candle = candles[i]
+            if candle.ts == self.last_ts and candle.close == self.last_close:
+                return i + 1
+        return None
+
+
+def _advance(states: Dict[str, _RollingCloses], symbol: str, candles: List[Candle], new_state) -> _RollingCloses:
+    """
+    Bring the rolling state for `symbol` up to date with `candles`.
+    
+    Continues from the last candle seen when the series extends it; otherwise
+    (first sight, or a series that no longer continues) rebuilds the state from
+    just the candles its window covers.
+    """
+    state = states.get(symbol)
+    start = state.resume_index(candles) if state is not None else None
+    if start is None:
+        state = states[symbol] = new_state()
+        start = max(len(candles) - (state.window.maxlen or 0), 0)
+    
+    for i in range(start, len(candles)):
+        state.push(candles[i])
+    return state
+
+
+class _RollingSmaPair(_RollingCloses):
+    """
+    Fast and slow SMAs, for this bar and the previous one, over the last
+    `slow + 1` closes.
+    
+    Each SMA is summed afresh from the window rather than kept as a running
+    add/subtract total, so rounding never accumulates: equal closes give
+    exactly equal averages.
+    """
+
+    __slots__ = ("fast", "slow", "smas")
+
+    def __init__(self, fast: int, slow: int):
+        # One extra close so the previous bar's SMAs can be computed too
+        super().__init__(slow + 1)
+        self.fast = fast
+        self.slow = slow
+        self.smas = (0.0, 0.0, 0.0, 0.0)
+
+    def _on_push(self) -> None:
+        window = self.window
+        if len(window) < window.maxlen:
+            return
+        closes = list(window)
+        fast, slow = self.fast, self.slow
+        self.smas = (
+            sum(closes[-1 - fast:-1]) / fast,
+            sum(closes[-fast:]) / fast,
+            sum(closes[:-1]) / slow,
+            sum(closes[1:]) / slow,
+        )
+
+    def values(self):
+        """(fast_prev, fast_now, slow_prev, slow_now); needs a full window."""
+        return self.smas
+
+
+class _RollingRsi(_RollingCloses):
+    """
+    Gain/loss sums over the last `period` close-to-close changes.
+    
+    Summed afresh from the window on each push, newest change first as the
+    original list-based formula did, so a window without losses has a loss
+    sum of exactly 0.
+    """
+
+    __slots__ = ("gain_sum", "loss_sum")
+
+    def __init__(self, period: int):
+        super().__init__(period + 1)
+        self.gain_sum = 0.0
+        self.loss_sum = 0.0
+
+    def _on_push(self) -> None:
+        window = self.window
+        if len(window) < window.maxlen:
+            return
+        closes = list(window)
+        gain_sum = 0.0
+        loss_sum = 0.0
+        for i in range(len(closes) - 1, 0, -1):
+            ch = closes[i] - closes[i - 1]
+            if ch > 0:
+                gain_sum += ch
+            else:
+                loss_sum -= ch
+        self.gain_sum = gain_sum
+        self.loss_sum = loss_sum
+
+
+class _RollingWilderRsi(_RollingCloses):
+    """
+    Wilder-smoothed average gain/loss: seeded with the simple mean of the first
+    `period` changes, then `avg = (avg * (period - 1) + change) / period`.
+    """
+
+    __slots__ = ("period", "changes", "avg_gain", "avg_loss")
+
+    def __init__(self, period: int):
+        # Only the previous close is needed; the window just satisfies resume_index
+        super().__init__(period + 1)
+        self.period = period
+        self.changes = 0
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+
+    def _on_push(self) -> None:
+        window = self.window
+        if len(window) < 2:
+            return
+        ch = window[-1] - window[-2]
+        gain = ch if ch > 0 else 0.0
+        loss = -ch if ch < 0 else 0.0
+        period = self.period
+        self.changes += 1
+        if self.changes <= period:
+            self.avg_gain += gain / period
+            self.avg_loss += loss / period
+        else:
+            self.avg_gain = (self.avg_gain * (period - 1) + gain) / period
+            self.avg_loss = (self.avg_loss * (period - 1) + loss) / period
+
+
 class SmaCrossoverStrategy(SignalProcessor):
     """
     Classic SMA crossover:
@@ -31,57 +220,59 @@ class SmaCrossoverStrategy(SignalProcessor):
       - Otherwise FLAT with low confidence
     """
 
+    __slots__ = ("fast", "slow", "min_confidence", "_rolling", "_new_state")
+
     def __init__(self, fast: int = 10, slow: int = 30, min_confidence: float = 0.55):
         assert fast < slow, "fast SMA must be < slow SMA"
         self.fast = fast
         self.slow = slow
         self.min_confidence = min_confidence
+        # Per-symbol running SMA sums, advanced one candle at a time
+        self._rolling: Dict[str, _RollingSmaPair] = {}
+        # Built once rather than as a new closure on every generate() call
+        self._new_state = partial(_RollingSmaPair, fast, slow)
 
     def generate(self, snapshot: MarketSnapshot) -> Signal:
-        closes = [c.close for c in snapshot.candles]
-        fast_sma = sma(closes, self.fast)
-        slow_sma = sma(closes, self.slow)
+        candles = snapshot.candles
 
         # Need at least two recent points for crossover
-        if len(closes) < self.slow + 1:
-            return Signal(snapshot.symbol, "flat", 0.0, {"reason": "insufficient_data"})
+        if len(candles) < self.slow + 1:
+            return Signal(snapshot.symbol, "flat", 0.0, _INSUFFICIENT_DATA_META)
 
-        f_prev, f_now = fast_sma[-2], fast_sma[-1]
-        s_prev, s_now = slow_sma[-2], slow_sma[-1]
-        price = closes[-1]
-
-        # If any None -> insufficient data
-        if any(v is None for v in (f_prev, f_now, s_prev, s_now)):
-            return Signal(snapshot.symbol, "flat", 0.0, {"reason": "insufficient_data"})
-
-        crossed_up = f_prev < s_prev and f_now > s_now
-        crossed_dn = f_prev > s_prev and f_now < s_now
+        state = _advance(self._rolling, snapshot.symbol, candles, self._new_state)
+        return self._signal(snapshot.symbol, candles[-1].close, *state.values())
 
+    def _signal(self, symbol: str, price: float, f_prev: float, f_now: float,
+                s_prev: float, s_now: float) -> Signal:
         # Confidence: distance of SMAs vs price volatility proxy
         distance = abs((f_now - s_now) / price)
         confidence = min(1.0, 0.5 + distance * 20)  # simple scaling into [0,1]
 
-        if crossed_up and confidence >= self.min_confidence:
-            return Signal(snapshot.symbol, "buy", confidence, {
-                "price": price,
-                "fast_sma": f_now,
-                "slow_sma": s_now,
-                "event": "bullish_crossover"
-            })
-        elif crossed_dn and confidence >= self.min_confidence:
-            return Signal(snapshot.symbol, "sell", confidence, {
-                "price": price,
-                "fast_sma": f_now,
-                "slow_sma": s_now,
-                "event": "bearish_crossover"
-            })
-        else:
-            return Signal(snapshot.symbol, "flat", max(0.1, confidence * 0.5), {
-                "price": price,
-                "fast_sma": f_now,
-                "slow_sma": s_now,
-                "event": "no_signal"
-            })
+        # Most bars don't cross: one comparison against the previous bar settles
+        # that before the confidence threshold is looked at
+        if f_now > s_now:
+            if f_prev < s_prev and confidence >= self.min_confidence:
+                return Signal(symbol, "buy", confidence, {
+                    "price": price,
+                    "fast_sma": f_now,
+                    "slow_sma": s_now,
+                    "event": "bullish_crossover"
+                })
+        elif f_now < s_now:
+            if f_prev > s_prev and confidence >= self.min_confidence:
+                return Signal(symbol, "sell", confidence, {
+                    "price": price,
+                    "fast_sma": f_now,
+                    "slow_sma": s_now,
+                    "event": "bearish_crossover"
+                })
+        
+        return Signal(symbol, "flat", max(0.1, confidence * 0.5), {
+            "price": price,
+            "fast_sma": f_now,
+            "slow_sma": s_now,
+            "event": "no_signal"
+        })
 
 
 class RsiStrategy(SignalProcessor):
@@ -90,41 +281,52 @@ class RsiStrategy(SignalProcessor):
       - BUY when RSI is oversold
       - SELL when RSI is overbought 
       - Otherwise FLAT
+    
+    smoothing="simple" averages the last `period` changes; "wilder" uses
+    Wilder's recursive smoothing over every change seen so far.
     """
 
-    def __init__(self, period=14, oversold=30, overbought=70):
+    __slots__ = ("period", "oversold", "overbought", "smoothing", "_rolling", "_new_state")
+
+    def __init__(self, period=14, oversold=30, overbought=70, smoothing="simple"):
+        if smoothing not in ("simple", "wilder"):
+            raise ValueError(f"Unknown RSI smoothing: {smoothing!r}")
         self.period = period
         self.oversold = oversold
         self.overbought = overbought
+        self.smoothing = smoothing
+        # Per-symbol running gain/loss state, advanced one candle at a time
+        self._rolling: Dict[str, _RollingCloses] = {}
+        self._new_state = partial(_RollingWilderRsi if smoothing == "wilder" else _RollingRsi, period)
 
     def generate(self, snapshot: MarketSnapshot) -> Signal:
-        closes = [c.close for c in snapshot.candles]
-        if len(closes) < self.period + 1:
-            return Signal(snapshot.symbol, "flat", 0.0, {"reason": "insufficient"})
+        candles = snapshot.candles
+        if len(candles) < self.period + 1:
+            return Signal(snapshot.symbol, "flat", 0.0, _INSUFFICIENT_META)
         
-        # minimal RSI calculation
-        gains = []
-        losses = []
-        for i in range(1, self.period + 1):
-            ch = closes[-i] - closes[-i-1]
-            gains.append(max(ch, 0))
-            losses.append(max(-ch, 0))
+        state = _advance(self._rolling, snapshot.symbol, candles, self._new_state)
+        if self.smoothing == "wilder":
+            return self._signal(snapshot.symbol, state.avg_gain, state.avg_loss)
         
-        avg_gain = sum(gains) / self.period
-        avg_loss = sum(losses) / self.period or 1e-9
-        rs = avg_gain / avg_loss
+        # minimal RSI calculation over the last `period` changes
+        return self._signal(snapshot.symbol, state.gain_sum / self.period, state.loss_sum / self.period)
+
+    def _signal(self, symbol: str, avg_gain: float, avg_loss: float) -> Signal:
+        rs = avg_gain / (avg_loss or 1e-9)
         rsi = 100 - (100 / (1 + rs))
         
         if rsi < self.oversold:
-            return Signal(snapshot.symbol, "buy", 0.6, {"rsi": rsi})
+            return Signal(symbol, "buy", 0.6, {"rsi": rsi})
         if rsi > self.overbought:
-            return Signal(snapshot.symbol, "sell", 0.6, {"rsi": rsi})
-        return Signal(snapshot.symbol, "flat", 0.2, {"rsi": rsi})
+            return Signal(symbol, "sell", 0.6, {"rsi": rsi})
+        return Signal(symbol, "flat", 0.2, {"rsi": rsi})
 
 
 class ComboStrategy(SignalProcessor):
     """Combines SMA crossover with RSI confirmation."""
     
+    __slots__ = ("sma_strategy", "rsi_strategy")
+    
     def __init__(self, fast=10, slow=30, rsi_period=14, rsi_oversold=30, rsi_overbought=70):
         self.sma_strategy = SmaCrossoverStrategy(fast, slow)
         self.rsi_strategy = RsiStrategy(rsi_period, rsi_oversold, rsi_overbought)
@@ -132,11 +334,17 @@ class ComboStrategy(SignalProcessor):
     def generate(self, snapshot: MarketSnapshot) -> Signal:
         sma_signal = self.sma_strategy.generate(snapshot)
         rsi_signal = self.rsi_strategy.generate(snapshot)
+        return self._combine(snapshot.symbol, sma_signal, rsi_signal)
+
+    @staticmethod
+    def _combine(symbol: str, sma_signal: Signal, rsi_signal: Signal) -> Signal:
+        sides = (sma_signal.side, rsi_signal.side)
+        rule = _COMBO_RULES.get(sides)
         
         # If both agree on direction, boost confidence
-        if sma_signal.side == rsi_signal.side and sma_signal.side != "flat":
+        if rule == _COMBO_AGREE:
             combined_confidence = min(1.0, (sma_signal.confidence + rsi_signal.confidence) / 2 * 1.3)
-            return Signal(snapshot.symbol, sma_signal.side, combined_confidence, {
+            return Signal(symbol, sma_signal.side, combined_confidence, {
                 "sma_signal": sma_signal.side,
                 "sma_confidence": sma_signal.confidence,
                 "rsi_signal": rsi_signal.side, 
@@ -144,25 +352,26 @@ class ComboStrategy(SignalProcessor):
                 "reason": "SMA and RSI agree"
             })
         
-        # If they disagree or one is flat, use lower confidence
-        if sma_signal.side != "flat" and rsi_signal.side == "flat":
-            # Use SMA signal but with reduced confidence
-            return Signal(snapshot.symbol, sma_signal.side, sma_signal.confidence * 0.7, {
+        # If one is flat, follow the other with lower confidence
+        if rule == _COMBO_SMA_ONLY:
+            return Signal(symbol, sma_signal.side, sma_signal.confidence * 0.7, {
                 "reason": "SMA signal, RSI neutral",
                 "sma_meta": sma_signal.meta,
                 "rsi_meta": rsi_signal.meta
             })
-        elif sma_signal.side == "flat" and rsi_signal.side != "flat":
-            # Use RSI signal but with reduced confidence  
-            return Signal(snapshot.symbol, rsi_signal.side, rsi_signal.confidence * 0.7, {
+        if rule == _COMBO_RSI_ONLY:
+            return Signal(symbol, rsi_signal.side, rsi_signal.confidence * 0.7, {
                 "reason": "RSI signal, SMA neutral",
                 "sma_meta": sma_signal.meta,
                 "rsi_meta": rsi_signal.meta
             })
-        else:
-            # Both flat or they disagree - stay flat
-            return Signal(snapshot.symbol, "flat", 0.3, {
+        
+        # Both flat or they disagree - stay flat
+        meta = _COMBO_FLAT_META.get(sides)
+        if meta is None:
+            meta = {
                 "reason": "Signals disagree or both flat",
                 "sma_signal": sma_signal.side,
                 "rsi_signal": rsi_signal.side
-            })
+            }
+        return Signal(symbol, "flat", 0.3, meta)
@@ -4,12 +4,27 @@ Main trading agent orchestrator.
 This module coordinates data fetch, signal generation, risk management and execution.
 """
 
-import time
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
-from .base import MarketDataProvider, SignalProcessor, TradeExecutor, PreTradeFilter, OrderRequest
+import random
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+from .base import (
+    Candle, MarketDataProvider, MarketSnapshot, SignalProcessor, TradeExecutor, PreTradeFilter,
+    OrderRequest, Signal, filter_checks,
+)
 from .risk_manager import RiskManager
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; trade levels are computed per symbol without it
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; batched trade levels use plain NumPy without it
+    njit = None
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -17,10 +32,78 @@ logging.basicConfig(
 )
 log = logging.getLogger("bot")
 
+# Placeholder passed to filters that ignore the signal, before one exists
+_NO_SIGNAL = Signal(symbol="", side="flat", confidence=0.0)
+
+# Below this many signals, per-symbol level math is cheaper than building arrays
+_BATCH_LEVELS_MIN = 16
+
+def _check_no_running_loop(method: str) -> None:
+    """Raise a clear error when a blocking runner is called from inside an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    raise RuntimeError(
+        f"{method}() blocks and can't run inside an event loop (e.g. a notebook or "
+        f"async app); use 'await agent.{method}_async(...)' instead"
+    )
+
+
+# Side codes for _trade_levels_kernel
+_BUY, _SELL, _FLAT = 0, 1, 2
+
+
+def _trade_levels_kernel(prices, side_codes):
+    """
+    (entries, stops, targets, rr_ratios) for aligned price/side-code arrays,
+    one pass with the same branches as `_derive_trade_levels` and
+    `_risk_reward`. Written for Numba; compiled below when it is installed.
+    """
+    n = prices.shape[0]
+    stops = np.empty(n, dtype=np.float64)
+    targets = np.empty(n, dtype=np.float64)
+    rrs = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        price = prices[i]
+        code = side_codes[i]
+        if code == _BUY:
+            stop = price * 0.985
+            target = price * 1.03
+            risk = max(1e-9, price - stop)
+            reward = max(0.0, target - price)
+        else:
+            if code == _SELL:
+                stop = price * 1.015
+                target = price * 0.97
+            else:
+                stop = price
+                target = price
+            risk = max(1e-9, stop - price)
+            reward = max(0.0, price - target)
+        stops[i] = stop
+        targets[i] = target
+        rrs[i] = reward / risk
+    return prices, stops, targets, rrs
+
+
+if njit is not None and np is not None:
+    # Compiled (or loaded from the on-disk cache) on the first batch, not at
+    # import; TradingAgent.warmup() triggers that ahead of live trading
+    _trade_levels_kernel = njit(cache=True)(_trade_levels_kernel)
+else:
+    _trade_levels_kernel = None
+
 
 class TradingAgent:
     """Coordinates data fetch, signal generation, risk & execution."""
 
+    __slots__ = (
+        "data", "strategy", "broker", "filters", "_pre_signal_checks", "_post_signal_checks",
+        "_flat_checks", "risk",
+        "poll_seconds", "max_concurrency", "poll_jitter_seconds", "display_every",
+    )
+
     def __init__(
         self,
         data: MarketDataProvider,
@@ -29,6 +112,9 @@ class TradingAgent:
         filters: Optional[List[PreTradeFilter]] = None,
         risk: Optional[RiskManager] = None,
         poll_seconds: int = 5,
+        max_concurrency: int = 8,
+        poll_jitter_seconds: Optional[float] = None,
+        display_every: int = 10,
     ):
         """
         Initialize trading agent.
@@ -40,13 +126,64 @@ class TradingAgent:
             filters: Optional list of pre-trade filters
             risk: Risk manager for position sizing
             poll_seconds: Polling interval for continuous trading
+            max_concurrency: Maximum snapshot fetches in flight at once
+            poll_jitter_seconds: Random +/- offset added to each wait so several
+                agents don't poll in lockstep (default: 10% of poll_seconds)
+            display_every: In continuous mode, report skipped signals only every
+                N iterations (executed orders and errors are always reported)
         """
         self.data = data
         self.strategy = strategy
         self.broker = broker
         self.filters = filters or []
+        # Signal-independent filters run before the strategy, so a rejection
+        # skips signal generation entirely; the rest need the signal
+        post_signal_filters = [f for f in self.filters if not f.ignores_signal]
+        self._pre_signal_checks = filter_checks([f for f in self.filters if f.ignores_signal])
+        self._post_signal_checks = filter_checks(post_signal_filters)
+        # Post-signal filters that can still block a 'flat' signal (the rest always pass it)
+        self._flat_checks = filter_checks([f for f in post_signal_filters if not f.always_allows_flat])
         self.risk = risk or RiskManager(account_equity=10_000, risk_per_trade=0.01)
         self.poll_seconds = poll_seconds
+        self.max_concurrency = max_concurrency
+        self.poll_jitter_seconds = 0.1 * poll_seconds if poll_jitter_seconds is None else poll_jitter_seconds
+        self.display_every = max(1, display_every)
+
+    def warmup(self, lookback: int = 200) -> None:
+        """
+        Exercise the strategy, filters and risk sizing once on synthetic data.
+        
+        Call before the first live iteration so lazy imports, first-call setup
+        and JIT compilation happen up front instead of on the first real tick.
+        Nothing is fetched or executed. Components that keep per-symbol state
+        will hold a small entry for the '__warmup__' symbol.
+        """
+        start = datetime.utcnow() - timedelta(hours=lookback)
+        candles = []
+        for i in range(lookback):
+            price = 100.0 + (i % 7) * 0.5  # small zig-zag so returns/RSI are non-degenerate
+            candles.append(Candle(ts=start + timedelta(hours=i), open=price, high=price,
+                                  low=price, close=price, volume=1.0))
+        snap = MarketSnapshot(symbol="__warmup__", candles=candles)
+        
+        self.strategy.generate(snap)
+        signal = Signal(snap.symbol, "buy", 1.0)
+        for filter_obj in self.filters:
+            filter_obj.allow(snap, signal)
+        
+        levels = self._derive_trade_levels(candles[-1].close, "buy")
+        self._risk_reward(levels["entry"], levels["stop"], levels["target"], "buy")
+        self.risk.position_size(levels["entry"], levels["stop"])
+        # A full-size batch, so the vectorized/compiled level path is exercised too
+        entries, stops, _, _ = self._trade_levels([candles[-1].close] * _BATCH_LEVELS_MIN, ["buy"] * _BATCH_LEVELS_MIN)
+        self.risk.position_sizes(entries, stops)
+
+    def _poll_delay(self) -> float:
+        """Seconds to wait before the next iteration: poll_seconds plus jitter."""
+        jitter = self.poll_jitter_seconds
+        if jitter <= 0:
+            return self.poll_seconds
+        return max(0.0, self.poll_seconds + random.uniform(-jitter, jitter))
 
     def _derive_trade_levels(self, price: float, side: str) -> Dict[str, float]:
         """
@@ -96,6 +233,52 @@ class TradingAgent:
             reward = max(0.0, entry - target)
         return reward / risk if risk > 0 else 0.0
 
+    def _trade_levels(self, prices: Sequence[float], sides: Sequence[str]) -> Tuple[List[float], List[float], List[float], List[float]]:
+        """
+        Entry, stop, target and risk/reward for many signals at once.
+        
+        Same rules as `_derive_trade_levels` and `_risk_reward`, vectorized
+        with NumPy when it is installed and there are enough signals to pay
+        for the arrays, and compiled to a single loop with Numba when that is
+        installed too. The scalar methods stay plain Python: for one symbol,
+        calling into a compiled function costs about as much as the math.
+        
+        Args:
+            prices: Current market prices
+            sides: Signal sides, aligned with `prices`
+            
+        Returns:
+            (entries, stops, targets, rr_ratios) as lists aligned with `prices`
+        """
+        if np is None or len(prices) < _BATCH_LEVELS_MIN:
+            entries: List[float] = []
+            stops: List[float] = []
+            targets: List[float] = []
+            rrs: List[float] = []
+            for price, side in zip(prices, sides):
+                levels = self._derive_trade_levels(price, side)
+                entries.append(levels["entry"])
+                stops.append(levels["stop"])
+                targets.append(levels["target"])
+                rrs.append(self._risk_reward(levels["entry"], levels["stop"], levels["target"], side))
+            return entries, stops, targets, rrs
+        
+        entry = np.asarray(prices, dtype=np.float64)
+        side = np.asarray(sides)
+        buy = side == "buy"
+        sell = side == "sell"
+        if _trade_levels_kernel is not None:
+            codes = np.where(buy, _BUY, np.where(sell, _SELL, _FLAT)).astype(np.int8)
+            return tuple(a.tolist() for a in _trade_levels_kernel(entry, codes))
+        
+        stop = entry * np.where(buy, 0.985, np.where(sell, 1.015, 1.0))
+        target = entry * np.where(buy, 1.03, np.where(sell, 0.97, 1.0))
+        # Everything but 'buy' takes _risk_reward's mirrored branch
+        direction = np.where(buy, 1.0, -1.0)
+        risk = np.maximum(1e-9, direction * (entry - stop))
+        reward = np.maximum(0.0, direction * (target - entry))
+        return entry.tolist(), stop.tolist(), target.tolist(), (reward / risk).tolist()
+
     def run_once(self, symbols: List[str]) -> List[Dict[str, Any]]:
         """
         Run a single evaluation over symbols.
@@ -106,81 +289,179 @@ class TradingAgent:
         Returns:
             List of JSON-serializable summaries of signals considered
         """
-        summaries: List[Dict[str, Any]] = []
-
+        snaps: List[Any] = []
         for symbol in symbols:
             try:
                 # Fetch market data
-                snap = self.data.get_snapshot(symbol, lookback=200, timeframe="1h")
-                signal = self.strategy.generate(snap)
-
-                # Apply filters
-                filtered = False
-                for filter_obj in self.filters:
-                    if not filter_obj.allow(snap, signal):
-                        log.info(f"[Filter] Blocked {signal.side} signal for {symbol} by {filter_obj.__class__.__name__}")
-                        filtered = True
-                        break
-
-                if filtered:
-                    continue
-
-                price = snap.candles[-1].close
-                levels = self._derive_trade_levels(price, signal.side)
-                rr = self._risk_reward(levels["entry"], levels["stop"], levels["target"], signal.side)
-
-                # Position sizing via risk manager
-                size = 0.0
-                if signal.side in ("buy", "sell"):
-                    size = self.risk.position_size(levels["entry"], levels["stop"])
-
-                summary = {
-                    "symbol": symbol,
-                    "side": signal.side,
-                    "confidence": round(signal.confidence, 3),
-                    "price": round(price, 4),
-                    "entry": round(levels["entry"], 4),
-                    "stop": round(levels["stop"], 4),
-                    "target": round(levels["target"], 4),
-                    "rr_ratio": round(rr, 2),
-                    "size_units": round(size, 4),
-                    "meta": signal.meta,
-                }
-                summaries.append(summary)
-
-                # Example execution rule: only take trades with RR >= 1.5 and confidence >= 0.6
-                if signal.side in ("buy", "sell") and rr >= 1.5 and signal.confidence >= 0.6 and size > 0:
-                    order = OrderRequest(
-                        symbol=symbol,
-                        side=signal.side,
-                        size=size,
-                        order_type="market",
-                        meta={"rr": rr, "confidence": signal.confidence},
-                    )
-                    res = self.broker.place_order(order)
-                    summary["order_result"] = {
-                        "ok": res.ok,
-                        "order_id": res.order_id,
-                        "filled_price": res.filled_price,
-                        "error": res.error,
-                    }
-                else:
-                    summary["order_result"] = {"ok": False, "reason": "did_not_meet_rules"}
+                snaps.append(self.data.get_snapshot(symbol, lookback=200, timeframe="1h"))
+            except Exception as e:
+                snaps.append(e)
+
+        return self._evaluate_all(symbols, snaps)
+
+    async def run_once_async(self, symbols: List[str]) -> List[Dict[str, Any]]:
+        """
+        Run a single evaluation over symbols, fetching all snapshots concurrently.
+        
+        Providers are synchronous, so each fetch runs in a worker thread; the
+        network waits overlap instead of adding up across symbols. At most
+        `max_concurrency` fetches run at once to stay within API rate limits.
+        
+        Args:
+            symbols: List of trading symbols to evaluate
+            
+        Returns:
+            List of JSON-serializable summaries of signals considered
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def fetch(symbol: str) -> MarketSnapshot:
+            async with semaphore:
+                return await asyncio.to_thread(self.data.get_snapshot, symbol, 200, "1h")
+        
+        snaps = await asyncio.gather(*(fetch(symbol) for symbol in symbols), return_exceptions=True)
+        return self._evaluate_all(symbols, snaps)
+
+    def _error_summary(self, symbol: str, error: Exception) -> Dict[str, Any]:
+        """Log a per-symbol processing error and build its summary entry."""
+        log.error(f"Error processing {symbol}: {error}")
+        return {
+            "symbol": symbol,
+            "error": str(error),
+            "order_result": {"ok": False, "reason": "processing_error"}
+        }
+
+    def _evaluate_all(self, symbols: List[str], snaps: Sequence[Any]) -> List[Dict[str, Any]]:
+        """
+        Evaluate one iteration's snapshots and execute the signals that pass.
+        
+        Signals are generated and filtered per symbol, then trade levels and
+        position sizes for all surviving signals are computed in one batch
+        before orders are placed in symbol order.
+        
+        Args:
+            symbols: Trading symbols
+            snaps: Snapshot (or the exception raised fetching it) per symbol
+            
+        Returns:
+            List of JSON-serializable summaries of signals considered
+        """
+        summaries: List[Optional[Dict[str, Any]]] = []
+        # (summary slot, symbol, signal, price) for signals that passed the filters
+        pending: List[Tuple[int, str, Signal, float]] = []
+
+        for symbol, snap in zip(symbols, snaps):
+            try:
+                if isinstance(snap, BaseException):
+                    raise snap
+                signal = self._signal(symbol, snap)
+                if signal is not None:
+                    pending.append((len(summaries), symbol, signal, snap.candles[-1].close))
+                    summaries.append(None)
 
             except Exception as e:
-                log.error(f"Error processing {symbol}: {e}")
-                summaries.append({
-                    "symbol": symbol,
-                    "error": str(e),
-                    "order_result": {"ok": False, "reason": "processing_error"}
-                })
+                summaries.append(self._error_summary(symbol, e))
+
+        if pending:
+            prices = [price for _, _, _, price in pending]
+            entries, stops, targets, rrs = self._trade_levels(prices, [signal.side for _, _, signal, _ in pending])
+            # 'flat' levels have entry == stop, which position sizing maps to 0
+            sizes = self.risk.position_sizes(entries, stops)
+            if np is not None:
+                sizes = sizes.tolist()
+            
+            for (slot, symbol, signal, price), entry, stop, target, rr, size in zip(
+                    pending, entries, stops, targets, rrs, sizes):
+                try:
+                    summaries[slot] = self._execute(symbol, signal, price, entry, stop, target, rr, size)
+                except Exception as e:
+                    summaries[slot] = self._error_summary(symbol, e)
 
         return summaries
 
+    def _signal(self, symbol: str, snap: MarketSnapshot) -> Optional[Signal]:
+        """
+        Generate and filter the signal for one symbol.
+        
+        Returns:
+            The signal, or None if a filter blocked it
+        """
+        for allow, filter_name in self._pre_signal_checks:
+            if not allow(snap, _NO_SIGNAL):
+                log.info("[Filter] Blocked %s before signal generation by %s", symbol, filter_name)
+                return None
+
+        signal = self.strategy.generate(snap)
+
+        # Apply filters
+        active_checks = self._flat_checks if signal.side == 'flat' else self._post_signal_checks
+        for allow, filter_name in active_checks:
+            if not allow(snap, signal):
+                log.info("[Filter] Blocked %s signal for %s by %s", signal.side, symbol, filter_name)
+                return None
+
+        return signal
+
+    def _execute(self, symbol: str, signal: Signal, price: float, entry: float, stop: float,
+                 target: float, rr: float, size: float) -> Dict[str, Any]:
+        """
+        Summarize a sized signal and execute it if the rules pass.
+        
+        Returns:
+            Summary of the signal considered, with its order result
+        """
+        summary = {
+            "symbol": symbol,
+            "side": signal.side,
+            "confidence": round(signal.confidence, 3),
+            "price": round(price, 4),
+            "entry": round(entry, 4),
+            "stop": round(stop, 4),
+            "target": round(target, 4),
+            "rr_ratio": round(rr, 2),
+            "size_units": round(size, 4),
+            "meta": signal.meta,
+        }
+
+        # Example execution rule: only take trades with RR >= 1.5 and confidence >= 0.6
+        if signal.side in ("buy", "sell") and rr >= 1.5 and signal.confidence >= 0.6 and size > 0:
+            order = OrderRequest(
+                symbol=symbol,
+                side=signal.side,
+                size=size,
+                order_type="market",
+                meta={"rr": rr, "confidence": signal.confidence},
+            )
+            res = self.broker.place_order(order)
+            summary["order_result"] = {
+                "ok": res.ok,
+                "order_id": res.order_id,
+                "filled_price": res.filled_price,
+                "error": res.error,
+            }
+        else:
+            summary["order_result"] = {"ok": False, "reason": "did_not_meet_rules"}
+
+        return summary
+
     def run_loop(self, symbols: List[str], iterations: int = 3):
         """
         Simple loop runner (blocking).
         
+        Each iteration fetches all symbols concurrently; see `run_loop_async`,
+        which is what to await from code already inside an event loop.
+        
+        Args:
+            symbols: List of trading symbols
+            iterations: Number of iterations to run
+        """
+        _check_no_running_loop("run_loop")
+        asyncio.run(self.run_loop_async(symbols, iterations))
+
+    async def run_loop_async(self, symbols: List[str], iterations: int = 3):
+        """
+        Run a fixed number of iterations without blocking the event loop.
+        
         Args:
             symbols: List of trading symbols
             iterations: Number of iterations to run
@@ -188,65 +469,87 @@ class TradingAgent:
         log.info(f"🚀 Starting trading agent with {len(symbols)} symbols for {iterations} iterations")
         
         for i in range(iterations):
-            log.info(f"--- Iteration {i+1}/{iterations} ---")
-            results = self.run_once(symbols)
+            log.info("--- Iteration %d/%d ---", i + 1, iterations)
+            results = await self.run_once_async(symbols)
             
+            # Checked once per iteration; skips building per-result lines when INFO is off
+            info_enabled = log.isEnabledFor(logging.INFO)
             for result in results:
                 if "error" in result:
                     log.error(f"❌ {result['symbol']}: {result['error']}")
-                else:
+                elif info_enabled:
                     side = result['side'].upper()
                     conf = result['confidence']
                     price = result['price']
                     rr = result['rr_ratio']
                     
                     order_status = "✅ EXECUTED" if result["order_result"]["ok"] else "⏸️ SKIPPED"
-                    log.info(f"{order_status} | {result['symbol']} {side} | Price: {price} | Conf: {conf:.2%} | RR: {rr}")
+                    log.info("%s | %s %s | Price: %s | Conf: %.2f%% | RR: %s",
+                             order_status, result['symbol'], side, price, conf * 100, rr)
                     
                     # Log order details if executed
                     if result["order_result"]["ok"]:
-                        order_id = result["order_result"].get("order_id", "N/A")
-                        log.info(f"         Order ID: {order_id}")
+                        log.info("         Order ID: %s", result["order_result"].get("order_id", "N/A"))
             
             # Wait before next iteration
             if i < iterations - 1:  # Don't sleep after the last iteration
-                log.info(f"💤 Waiting {self.poll_seconds}s before next iteration...")
-                time.sleep(self.poll_seconds)
+                delay = self._poll_delay()
+                log.info("💤 Waiting %.1fs before next iteration...", delay)
+                await asyncio.sleep(delay)
         
         log.info("🏁 Trading agent completed all iterations")
 
     def run_continuous(self, symbols: List[str]):
         """
-        Run continuously until interrupted.
+        Run continuously until interrupted (blocking).
+        
+        From code already inside an event loop, await `run_continuous_async`.
         
         Args:
             symbols: List of trading symbols
         """
-        log.info(f"🔄 Starting continuous trading with {len(symbols)} symbols")
+        _check_no_running_loop("run_continuous")
         log.info("Press Ctrl+C to stop")
         
-        iteration = 0
         try:
-            while True:
-                iteration += 1
-                log.info(f"--- Continuous Iteration #{iteration} ---")
-                results = self.run_once(symbols)
-                
-                for result in results:
-                    if "error" in result:
-                        log.error(f"❌ {result['symbol']}: {result['error']}")
-                    else:
-                        side = result['side'].upper()
-                        conf = result['confidence']
-                        price = result['price']
-                        
-                        order_status = "✅ EXECUTED" if result["order_result"]["ok"] else "⏸️ SKIPPED"
-                        log.info(f"{order_status} | {result['symbol']} {side} | Price: {price} | Conf: {conf:.2%}")
-                
-                time.sleep(self.poll_seconds)
-                
+            asyncio.run(self.run_continuous_async(symbols))
         except KeyboardInterrupt:
             log.info("\n⏹️ Trading agent stopped by user")
         except Exception as e:
             log.error(f"💥 Unexpected error: {e}")
             raise
+
+    async def run_continuous_async(self, symbols: List[str]):
+        """
+        Run continuously until cancelled, without blocking the event loop.
+        
+        Snapshots are fetched concurrently each iteration and the wait between
+        iterations is an asyncio sleep, so this can share a loop with other tasks.
+        
+        Args:
+            symbols: List of trading symbols
+        """
+        log.info(f"🔄 Starting continuous trading with {len(symbols)} symbols")
+        
+        iteration = 0
+        while True:
+            iteration += 1
+            log.info("--- Continuous Iteration #%d ---", iteration)
+            results = await self.run_once_async(symbols)
+            
+            info_enabled = log.isEnabledFor(logging.INFO)
+            # Full status only every display_every iterations; trading cadence is unaffected
+            show_skipped = (iteration - 1) % self.display_every == 0
+            for result in results:
+                if "error" in result:
+                    log.error(f"❌ {result['symbol']}: {result['error']}")
+                elif info_enabled and (show_skipped or result["order_result"]["ok"]):
+                    side = result['side'].upper()
+                    conf = result['confidence']
+                    price = result['price']
+                    
+                    order_status = "✅ EXECUTED" if result["order_result"]["ok"] else "⏸️ SKIPPED"
+                    log.info("%s | %s %s | Price: %s | Conf: %.2f%%",
+                             order_status, result['symbol'], side, price, conf * 100)
+            
+            await asyncio.sleep(self._poll_delay())
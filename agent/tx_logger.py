@@ -5,15 +5,32 @@ This module provides structured logging for transaction execution,
 including JSONL logging for analysis and standard logging for debugging.
 """
 
+import atexit
 import json
 import os
+import threading
+import weakref
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Dict, Optional
 
 from loguru import logger
+import orjson
 import sys
 
+# Non-str dict keys are stringified like json.dumps does; each line gets its newline
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+
+# Loggers with JSONL files possibly open; weak, so dropping a logger frees its handles
+_live_loggers: "weakref.WeakSet[TxLogger]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_loggers() -> None:
+    """Close every remaining logger's JSONL files at interpreter exit."""
+    for tx_logger in list(_live_loggers):
+        tx_logger.close()
+
 
 class TxLogger:
     """
@@ -23,16 +40,24 @@ class TxLogger:
     human-readable logging for development and debugging.
     """
     
-    def __init__(self, log_dir: str = "logs", level: str = "INFO"):
+    def __init__(self, log_dir: str = "logs", level: str = "INFO", fsync_every: int = 0):
         """
         Initialize transaction logger.
         
         Args:
             log_dir: Directory to store log files
             level: Logging level (DEBUG, INFO, WARNING, ERROR)
+            fsync_every: fsync the JSONL files every N records (0 = leave it to the OS)
         """
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.fsync_every = fsync_every
+        
+        # JSONL files stay open between records; writes may come from several threads
+        self._handles: Dict[str, BinaryIO] = {}
+        self._handles_lock = threading.Lock()
+        self._unsynced = 0
+        _live_loggers.add(self)
         
         # Remove default logger and add custom ones
         logger.remove()
@@ -84,22 +109,80 @@ class TxLogger:
         if "timestamp" not in record:
             record["timestamp"] = datetime.now(timezone.utc).isoformat()
         
-        # Ensure we can serialize the record
+        # Ensure we can serialize the record (orjson emits UTF-8 bytes directly)
         try:
-            line = json.dumps(record, ensure_ascii=False, default=str)
+            line = orjson.dumps(record, default=str, option=_ORJSON_OPTIONS)
         except (TypeError, ValueError) as e:
-            # Fallback: convert problematic values to strings
+            # Fallback: convert problematic values to strings; the stdlib encoder
+            # also copes with what orjson rejects, such as integers beyond 64 bits
             sanitized = self._sanitize_for_json(record)
-            line = json.dumps(sanitized, ensure_ascii=False, default=str)
+            line = (json.dumps(sanitized, ensure_ascii=False, default=str) + "\n").encode("utf-8")
             self.logger.warning(f"Had to sanitize record for JSON serialization: {e}")
         
         # Write to file
         try:
-            with open(path, "a", encoding="utf-8") as f:
-                f.write(line + "\n")
+            with self._handles_lock:
+                f = self._get_handle(filename)
+                try:
+                    f.write(line)
+                    if self.fsync_every > 0:
+                        self._unsynced += 1
+                        if self._unsynced >= self.fsync_every:
+                            self._sync()
+                except Exception:
+                    # Reopen on the next record rather than reuse a broken handle
+                    self._handles.pop(filename, None)
+                    f.close()
+                    raise
         except Exception as e:
             self.logger.error(f"Failed to write to JSONL file {path}: {e}")
     
+    def _get_handle(self, filename: str) -> BinaryIO:
+        """
+        Append handle for a JSONL file, opened on first use.
+        
+        Unbuffered, so every record still reaches the OS in one write() call,
+        just without the open/close around it. Caller holds `_handles_lock`.
+        """
+        f = self._handles.get(filename)
+        if f is None:
+            f = self._handles[filename] = open(self.log_dir / filename, "ab", buffering=0)
+        return f
+    
+    def _sync(self) -> None:
+        """fsync every open JSONL file. Caller holds `_handles_lock`."""
+        for f in self._handles.values():
+            os.fsync(f.fileno())
+        self._unsynced = 0
+    
+    def close(self) -> None:
+        """Close the JSONL files; later records reopen them. Runs for live loggers at exit."""
+        with self._handles_lock:
+            handles = list(self._handles.values())
+            self._handles.clear()
+            if self.fsync_every > 0 and self._unsynced:
+                for f in handles:
+                    try:
+                        os.fsync(f.fileno())
+                    except OSError:
+                        pass
+                self._unsynced = 0
+            for f in handles:
+                f.close()
+    
+    def __enter__(self) -> "TxLogger":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def __del__(self) -> None:
+        # Open files would be closed by their own finalizers anyway; this also fsyncs them
+        try:
+            self.close()
+        except Exception:
+            pass
+    
     def _sanitize_for_json(self, obj: Any) -> Any:
         """Recursively sanitize an object to be JSON serializable."""
         if isinstance(obj, dict):
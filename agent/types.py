@@ -4,10 +4,15 @@ Type definitions for the modular trading agent.
 This module contains Pydantic models for structured data handling.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 from pydantic import BaseModel, Field
 from datetime import datetime
 
+try:
+    import msgspec
+except ImportError:  # msgspec is optional; ticks are then parsed with pydantic
+    msgspec = None
+
 
 class TokenTick(BaseModel):
     """Live token data from Dexscreener API."""
@@ -31,6 +36,49 @@ class TokenTick(BaseModel):
         }
 
 
+if msgspec is not None:
+    class TokenTickStruct(msgspec.Struct, frozen=True, kw_only=True):
+        """
+        msgspec mirror of TokenTick for the streaming hot path.
+        
+        Same fields and defaults; decoded in C without per-field Python
+        validation, so it is much cheaper to build than the pydantic model.
+        """
+        
+        source: str = "dexscreener"
+        chain: str = "solana"
+        token: str
+        price_usd: Optional[float] = None
+        volume_24h_usd: Optional[float] = None
+        liquidity_usd: Optional[float] = None
+        change_24h_pct: Optional[float] = None
+        pair_address: Optional[str] = None
+        slot: Optional[int] = None
+        rpc_healthy: bool = True
+        timestamp: Optional[datetime] = msgspec.field(default_factory=datetime.utcnow)
+else:
+    TokenTickStruct = None
+
+
+def parse_tick(tick_data: Dict[str, Any]) -> Union[TokenTick, "TokenTickStruct"]:
+    """
+    Build a tick object from a provider's tick dict.
+    
+    Uses `msgspec.convert` into TokenTickStruct when msgspec is installed and
+    pydantic validation into TokenTick otherwise. Both expose the same
+    attributes and raise on invalid data.
+    
+    Args:
+        tick_data: Tick dict as yielded by an AsyncMarketDataProvider
+        
+    Returns:
+        TokenTickStruct or TokenTick
+    """
+    if TokenTickStruct is not None:
+        return msgspec.convert(tick_data, TokenTickStruct, strict=False)
+    return TokenTick.model_validate(tick_data)
+
+
 class DexscreenerPair(BaseModel):
     """Dexscreener pair data structure."""
     
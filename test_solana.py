@@ -7,6 +7,7 @@ requiring actual API connections.
 
 import asyncio
 import logging
+import time
 from unittest.mock import AsyncMock, MagicMock
 from typing import AsyncIterator
 
@@ -14,6 +15,7 @@ from agent.types import TokenTick
 from agent.solana_agent import SolanaStreamingAgent
 from agent.strategy import RsiStrategy
 from agent.executor import PaperBroker
+from agent.base import SignalProcessor, TradeExecutor, Signal, OrderRequest, OrderResult
 from agent.filters import ConfidenceFilter
 from agent.risk_manager import RiskManager
 
@@ -78,6 +80,7 @@ async def test_single_cycle():
         filters=filters,
         risk_manager=risk_manager
     )
+    agent.warmup()
     
     # Run single cycle
     results = await agent.run_single_cycle(["MOCK_TOKEN"], interval_sec=1)
@@ -86,7 +89,8 @@ async def test_single_cycle():
     for result in results:
         log.info(f"Result: {result}")
     
-    return len(results) > 0
+    # One token -> exactly one tick fetched
+    return len(results) > 0 and data_provider.call_count == 1
 
 
 async def test_short_streaming():
@@ -178,6 +182,80 @@ async def test_strategy_integration():
     return len(signals) > 0 and len(combo_signals) > 0
 
 
+class AlwaysBuyStrategy(SignalProcessor):
+    """Strategy that buys every tick, so each processed tick places an order."""
+    
+    def generate(self, snapshot) -> Signal:
+        return Signal(snapshot.symbol, "buy", 0.9)
+
+
+class SlowBroker(TradeExecutor):
+    """Broker whose fills finish out of submission order; 'BAD_FILL' orders raise."""
+    
+    def __init__(self, delays: dict):
+        self.delays = delays
+    
+    def place_order(self, order: OrderRequest) -> OrderResult:
+        time.sleep(self.delays.get(order.symbol, 0.0))
+        if order.symbol == "BAD_FILL":
+            raise RuntimeError("broker rejected BAD_FILL")
+        return OrderResult(ok=True, order_id=f"order-{order.symbol}")
+
+
+def mock_tick(token: str, price: float) -> dict:
+    return {"source": "mock", "chain": "solana", "token": token, "price_usd": price}
+
+
+async def test_process_batch():
+    """Test batch processing: error entries, repeated tokens and concurrent fills."""
+    log.info("\n=== Testing Batch Processing ===")
+    
+    # Earlier orders take longer, so fills complete in reverse order
+    broker = SlowBroker({"TOKEN_A": 0.15, "TOKEN_B": 0.1, "TOKEN_C": 0.05})
+    agent = SolanaStreamingAgent(
+        data_provider=MockDexScreenerProvider(),
+        strategy=AlwaysBuyStrategy(),
+        executor=broker,
+        max_concurrent_orders=4,
+    )
+    
+    # Unique tokens (batched price check), one unparseable tick, one failing order
+    batch = [
+        mock_tick("TOKEN_A", 1.0),
+        {"source": "mock", "price_usd": 2.0},  # no token: parsing fails
+        mock_tick("TOKEN_B", 2.0),
+        mock_tick("TOKEN_C", 3.0),
+        mock_tick("BAD_FILL", 4.0),
+    ]
+    results = await agent._process_batch(batch)
+    
+    first_ok = (
+        len(results) == len(batch)
+        and [r.order_id for r in (results[0], results[2], results[3])] == ["order-TOKEN_A", "order-TOKEN_B", "order-TOKEN_C"]
+        and all(r.executed and r.error is None for r in (results[0], results[2], results[3]))
+        and results[1].signal is None and results[1].error and results[1].tick_data is batch[1]
+        and results[4].signal is None and "BAD_FILL" in results[4].error
+    )
+    
+    # A repeated token falls back to the per-tick check, each tick seeing the one before
+    batch = [
+        mock_tick("TOKEN_A", 1.0),    # unchanged since the last batch: skipped
+        mock_tick("TOKEN_D", 5.0),    # first sight: processed
+        mock_tick("TOKEN_D", 5.0),    # no move from the tick just before: skipped
+        mock_tick("TOKEN_D", 5.5),    # +10%: processed
+    ]
+    results = await agent._process_batch(batch)
+    
+    second_ok = (
+        results[0] is None and results[2] is None
+        and results[1].price == 5.0 and results[1].order_id == "order-TOKEN_D"
+        and results[3].price == 5.5 and results[3].order_id == "order-TOKEN_D"
+    )
+    
+    log.info(f"Batch with unique tokens ok: {first_ok}, batch with repeated token ok: {second_ok}")
+    return first_ok and second_ok
+
+
 async def main():
     """Run all tests."""
     log.info("🧪 Testing Solana Integration Components")
@@ -187,6 +265,7 @@ async def main():
         ("Strategy Integration", test_strategy_integration),
         ("Single Cycle", test_single_cycle),
         ("Short Streaming", test_short_streaming),
+        ("Batch Processing", test_process_batch),
     ]
     
     results = []
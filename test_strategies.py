@@ -0,0 +1,207 @@
+"""
+Test script for the rolling-window strategies and filters.
+
+Checks SmaCrossoverStrategy, RsiStrategy and VolatilityFilter, which keep
+per-symbol rolling state, against the plain list-based formulas over the
+whole candle history.
+"""
+
+import logging
+import random
+from datetime import datetime, timedelta
+from typing import List
+
+from agent.base import Candle, MarketSnapshot
+from agent.filters import VolatilityFilter
+from agent.strategy import RsiStrategy, SmaCrossoverStrategy
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+log = logging.getLogger(__name__)
+
+
+FLAT_EVERY = 100
+FLAT_LEN = 30
+
+
+def make_candles(n: int, seed: int = 2) -> List[Candle]:
+    """
+    Random walk whose steps span several orders of magnitude (where running
+    sums lose the most precision), with a flat stretch every FLAT_EVERY candles.
+    """
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    candles: List[Candle] = []
+    price = 100.0
+    for i in range(n):
+        if i % FLAT_EVERY < FLAT_LEN:
+            close = price
+        else:
+            close = max(0.01, price + rng.choice((-1, 1)) * 10 ** rng.uniform(-6, 1))
+        candles.append(Candle(ts=start + timedelta(hours=i), open=price, high=max(price, close),
+                              low=min(price, close), close=close, volume=1000.0))
+        price = close
+    return candles
+
+
+def list_sma(closes: List[float], end: int, window: int) -> float:
+    """Simple average of the `window` closes ending at index `end` (inclusive)."""
+    return sum(closes[end - window + 1:end + 1]) / window
+
+
+def expected_sma_signal(strategy: SmaCrossoverStrategy, closes: List[float]):
+    n = len(closes)
+    f_prev, f_now = list_sma(closes, n - 2, strategy.fast), list_sma(closes, n - 1, strategy.fast)
+    s_prev, s_now = list_sma(closes, n - 2, strategy.slow), list_sma(closes, n - 1, strategy.slow)
+    return strategy._signal("TEST", closes[-1], f_prev, f_now, s_prev, s_now)
+
+
+def expected_rsi_signal(strategy: RsiStrategy, closes: List[float]):
+    gains, losses = [], []
+    for i in range(1, strategy.period + 1):
+        ch = closes[-i] - closes[-i - 1]
+        gains.append(max(ch, 0))
+        losses.append(max(-ch, 0))
+    return strategy._signal("TEST", sum(gains) / strategy.period, sum(losses) / strategy.period)
+
+
+def same_signal(a, b) -> bool:
+    return a.side == b.side and a.confidence == b.confidence and a.meta == b.meta
+
+
+def check_incremental(strategy, expected, min_candles: int, n: int = 3000) -> bool:
+    """Feed a growing history one candle at a time and compare every signal."""
+    candles = make_candles(n)
+    closes = [c.close for c in candles]
+    mismatches = []
+    for end in range(min_candles, n + 1):
+        got = strategy.generate(MarketSnapshot(symbol="TEST", candles=candles[:end]))
+        want = expected(strategy, closes[:end])
+        if not same_signal(got, want):
+            mismatches.append((end - 1, got.side, want.side, got.meta, want.meta))
+    if mismatches:
+        log.error(f"   {len(mismatches)} mismatches, first: {mismatches[0]}")
+    return not mismatches
+
+
+def test_sma_matches_list_formula() -> bool:
+    """SMA crossover signals match exact per-window averages over a long history."""
+    strategy = SmaCrossoverStrategy(fast=5, slow=20)
+    return check_incremental(strategy, expected_sma_signal, strategy.slow + 1)
+
+
+def test_rsi_matches_list_formula() -> bool:
+    """Simple RSI matches the list-based gain/loss sums, including flat windows."""
+    strategy = RsiStrategy(period=14)
+    return check_incremental(strategy, expected_rsi_signal, strategy.period + 1)
+
+
+def test_rsi_rebuild_after_gap() -> bool:
+    """A history that no longer continues the stored one is rebuilt from scratch."""
+    strategy = RsiStrategy(period=14)
+    first = make_candles(300, seed=1)
+    second = make_candles(300, seed=2)
+    strategy.generate(MarketSnapshot(symbol="TEST", candles=first))
+    got = strategy.generate(MarketSnapshot(symbol="TEST", candles=second))
+    want = expected_rsi_signal(strategy, [c.close for c in second])
+    return same_signal(got, want)
+
+
+def test_rsi_zero_on_flat_windows() -> bool:
+    """Once a flat stretch fills the window, RSI is exactly 0 (no gains, no losses)."""
+    strategy = RsiStrategy(period=14)
+    candles = make_candles(3000)
+    bad = []
+    for end in range(strategy.period + 1, len(candles) + 1):
+        sig = strategy.generate(MarketSnapshot(symbol="TEST", candles=candles[:end]))
+        pos = (end - 1) % FLAT_EVERY
+        if end > FLAT_EVERY and strategy.period <= pos < FLAT_LEN and sig.meta["rsi"] != 0.0:
+            bad.append((end - 1, sig.meta["rsi"]))
+    if bad:
+        log.error(f"   {len(bad)} flat windows with RSI != 0, first: {bad[0]}")
+    return not bad
+
+
+def list_volatility(closes: List[float], lookback: int) -> float:
+    """Population std of the returns over the last `lookback` closes."""
+    recent = closes[-lookback:]
+    returns = [(cur - prev) / prev for prev, cur in zip(recent, recent[1:]) if prev > 0]
+    if not returns:
+        return 0.0
+    mean = sum(returns) / len(returns)
+    return (sum((r - mean) ** 2 for r in returns) / len(returns)) ** 0.5
+
+
+def check_volatility(vf: VolatilityFilter, candles: List[Candle], start: int) -> List[tuple]:
+    """Feed a growing history to `vf` and collect indices where it disagrees with the list formula."""
+    closes = [c.close for c in candles]
+    bad = []
+    for end in range(start, len(candles) + 1):
+        got = vf._rolling_volatility("TEST", candles[:end])
+        want = list_volatility(closes[:end], vf.lookback)
+        if got != want:
+            bad.append((end - 1, got, want))
+    return bad
+
+
+def test_volatility_matches_list_formula() -> bool:
+    """Rolling volatility matches the full-window std, including a zero close in the window."""
+    vf = VolatilityFilter(lookback=20)
+    candles = make_candles(3000)
+    zero = candles[1500]
+    candles[1500] = Candle(ts=zero.ts, open=zero.open, high=zero.high, low=0.0, close=0.0, volume=zero.volume)
+    bad = check_volatility(vf, candles, 1)
+    if bad:
+        log.error(f"   {len(bad)} mismatches, first: {bad[0]}")
+    return not bad
+
+
+def test_volatility_rebuild_after_gap() -> bool:
+    """A history that no longer continues the stored one is rebuilt from scratch."""
+    vf = VolatilityFilter(lookback=20)
+    bad = check_volatility(vf, make_candles(300, seed=1), 1)
+    # Same symbol, unrelated series: the first call must rebuild, later ones resume
+    bad += check_volatility(vf, make_candles(300, seed=2), 250)
+    if bad:
+        log.error(f"   {len(bad)} mismatches, first: {bad[0]}")
+    return not bad
+
+
+def main():
+    """Run all strategy tests."""
+    log.info("🚀 Starting Strategy Tests")
+    log.info("=" * 50)
+
+    tests = [
+        ("SMA vs List Formula", test_sma_matches_list_formula),
+        ("RSI vs List Formula", test_rsi_matches_list_formula),
+        ("RSI Rebuild After Gap", test_rsi_rebuild_after_gap),
+        ("RSI Zero On Flat Windows", test_rsi_zero_on_flat_windows),
+        ("Volatility vs List Formula", test_volatility_matches_list_formula),
+        ("Volatility Rebuild After Gap", test_volatility_rebuild_after_gap),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            result = test_func()
+            status = "✅ PASS" if result else "❌ FAIL"
+            results.append(result)
+            log.info(f"{status} | {test_name}")
+        except Exception as e:
+            log.error(f"❌ FAIL | {test_name}: {e}")
+            results.append(False)
+
+    # Summary
+    passed = sum(results)
+    total = len(results)
+
+    log.info("=" * 50)
+    log.info(f"🎯 Test Summary: {passed}/{total} tests passed")
+
+    return passed == total
+
+
+if __name__ == "__main__":
+    exit(0 if main() else 1)
@@ -6,6 +6,7 @@ requiring actual API connections or private keys.
 """
 
 import asyncio
+import json
 import logging
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -26,10 +27,14 @@ class MockResponse:
     def __init__(self, json_data: Dict[str, Any], status: int = 200):
         self.json_data = json_data
         self.status = status
+        self.headers = {}
     
     async def json(self):
         return self.json_data
     
+    async def read(self):
+        return json.dumps(self.json_data).encode()
+    
     async def __aenter__(self):
         return self
     
@@ -169,6 +174,156 @@ async def test_gmgn_executor():
         return False
 
 
+async def test_gmgn_prefilter():
+    """Test that GmgnExecutor drops doomed quote requests before any HTTP call."""
+    log.info("\\n=== Testing GmgnExecutor Prefilter ===")
+    
+    rate_limit_response = MockResponse({"error": "Rate limited"}, status=429)
+    
+    executor = GmgnExecutor(logger=TxLogger(level="DEBUG"))
+    quote_req = create_test_quote_request()
+    
+    try:
+        # Blacklisted mint never reaches the API
+        executor.blacklist_mint(quote_req.token_out_mint)
+        with patch('aiohttp.ClientSession.get') as mock_get:
+            quote_result = await executor.get_quote(quote_req)
+            
+            assert not quote_result.ok, "Expected blacklisted quote to fail"
+            assert "blacklisted" in quote_result.error
+            assert not mock_get.called, "Blacklisted quote should not hit the API"
+            log.info(f"✅ Blacklist prefilter test passed: {quote_result.error}")
+        
+        # A 429 that survives retries puts the pair on cooldown
+        executor = GmgnExecutor(logger=TxLogger(level="DEBUG"), rate_limit_retries=2, retry_backoff=0.01)
+        with patch('aiohttp.ClientSession.get', return_value=rate_limit_response) as mock_get:
+            first = await executor.get_quote(quote_req)
+            second = await executor.get_quote(quote_req)
+            
+            assert not first.ok and not second.ok
+            assert "cooling down" in second.error
+            assert mock_get.call_count == 3, "Expected one attempt plus two retries, then no further calls"
+            log.info(f"✅ Rate limit cooldown test passed: {second.error}")
+        
+        return True
+        
+    except Exception as e:
+        log.error(f"❌ GmgnExecutor prefilter test failed: {e}")
+        return False
+
+
+async def test_gmgn_quote_cache():
+    """Test that repeat GMGN quotes within the TTL are served from cache."""
+    log.info("\\n=== Testing GmgnExecutor Quote Cache ===")
+    
+    quote_response = MockResponse({
+        "code": 0,
+        "data": {
+            "routes": [{
+                "priceUsd": "0.000162",
+                "outAmount": "162000",
+                "routeId": "gmgn-route-456"
+            }]
+        }
+    })
+    
+    executor = GmgnExecutor(logger=TxLogger(level="DEBUG"), quote_cache_ttl=60)
+    quote_req = create_test_quote_request()
+    
+    try:
+        with patch('aiohttp.ClientSession.get', return_value=quote_response) as mock_get:
+            first = await executor.get_quote(quote_req)
+            second = await executor.get_quote(quote_req)
+            
+            assert first.ok and second.ok
+            assert second.route_id == first.route_id
+            assert second is not first, "Cache should hand out copies"
+            assert second.raw.get("cached") is True
+            assert not first.raw.get("cached"), "Cache hits must not mutate the stored quote"
+            assert mock_get.call_count == 1, "Repeat quote should be served from cache"
+            log.info("✅ Quote cache test passed")
+        
+        return True
+        
+    except Exception as e:
+        log.error(f"❌ GmgnExecutor quote cache test failed: {e}")
+        return False
+
+
+async def test_gmgn_single_flight():
+    """Test that concurrent identical GMGN quotes share one HTTP request."""
+    log.info("\\n=== Testing GmgnExecutor Single-Flight Quotes ===")
+    
+    quote_response = MockResponse({
+        "code": 0,
+        "data": {
+            "routes": [{
+                "priceUsd": "0.000162",
+                "outAmount": "162000",
+                "routeId": "gmgn-route-456"
+            }]
+        }
+    })
+    
+    # Cache disabled so only request coalescing can avoid extra calls
+    executor = GmgnExecutor(logger=TxLogger(level="DEBUG"), quote_cache_ttl=0)
+    quote_req = create_test_quote_request()
+    
+    try:
+        with patch('aiohttp.ClientSession.get', return_value=quote_response) as mock_get:
+            results = await asyncio.gather(*(executor.get_quote(quote_req) for _ in range(3)))
+            
+            assert all(r.ok for r in results)
+            assert len({id(r) for r in results}) == 3, "Each caller should get its own copy"
+            assert mock_get.call_count == 1, "Concurrent duplicates should share one request"
+            assert not executor._quote_cache._inflight, "Finished requests should leave the in-flight map"
+            log.info("✅ Single-flight quote test passed")
+        
+        return True
+        
+    except Exception as e:
+        log.error(f"❌ GmgnExecutor single-flight test failed: {e}")
+        return False
+
+
+async def test_photon_quote_cache():
+    """Test that repeated Photon quotes within the TTL are served from cache."""
+    log.info("\\n=== Testing PhotonExecutor Quote Cache ===")
+    
+    quote_response = MockResponse({
+        "priceUsd": "0.000150",
+        "outAmount": "150000",
+        "routeId": "photon-route-123",
+        "priceImpact": "0.001"
+    })
+    
+    executor = PhotonExecutor(logger=TxLogger(level="DEBUG"), quote_cache_ttl=60)
+    quote_req = create_test_quote_request()
+    repeat_req = quote_req.model_copy()
+    nearby_req = quote_req.model_copy(update={"amount_in_atomic": quote_req.amount_in_atomic + 1000})
+    
+    try:
+        with patch('aiohttp.ClientSession.get', return_value=quote_response) as mock_get:
+            first = await executor.get_quote(quote_req)
+            second = await executor.get_quote(repeat_req)
+            
+            assert first.ok and second.ok
+            assert second.route_id == first.route_id
+            assert second.raw.get("cached") is True
+            assert not first.raw.get("cached"), "Cache hits must not mutate the stored quote"
+            assert mock_get.call_count == 1, "Same request should be served from cache"
+            
+            await executor.get_quote(nearby_req)
+            assert mock_get.call_count == 2, "A different amount must not reuse another amount's quote"
+            log.info("✅ Photon quote cache test passed")
+        
+        return True
+        
+    except Exception as e:
+        log.error(f"❌ PhotonExecutor quote cache test failed: {e}")
+        return False
+
+
 async def test_auto_executor():
     """Test AutoExecutor with mocked providers."""
     log.info("\\n=== Testing AutoExecutor ===")
@@ -315,7 +470,11 @@ async def main():
     
     tests = [
         ("PhotonExecutor", test_photon_executor),
+        ("PhotonExecutor Quote Cache", test_photon_quote_cache),
         ("GmgnExecutor", test_gmgn_executor),
+        ("GmgnExecutor Prefilter", test_gmgn_prefilter),
+        ("GmgnExecutor Quote Cache", test_gmgn_quote_cache),
+        ("GmgnExecutor Single-Flight", test_gmgn_single_flight),
         ("AutoExecutor", test_auto_executor),
         ("Error Handling", test_error_handling),
         ("Request Validation", test_validation),